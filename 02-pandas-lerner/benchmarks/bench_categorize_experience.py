@@ -0,0 +1,54 @@
+"""
+Benchmark categorize_experience_vectorized (searchsorted over bin edges) against
+.apply(categorize_experience) on synthetic years of experience.
+
+Run from the 02-pandas-lerner folder:
+    python benchmarks/bench_categorize_experience.py --values 10000000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add the parent directory (02-pandas-lerner) to sys.path to import utils_midproject
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils_midproject import categorize_experience, categorize_experience_vectorized
+
+
+def make_years(count, rng):
+    """Whole years, fractional years (including the 2-3 and 5-6 gaps), edges and NaN."""
+    years = rng.integers(0, 40, count).astype(float)
+    fractional = rng.random(count) < 0.2
+    years[fractional] = rng.uniform(0, 12, fractional.sum())
+    years[rng.random(count) < 0.05] = np.nan
+    return pd.Series(years, name='years')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--values', type=int, default=10_000_000)
+    args = parser.parse_args()
+
+    years = make_years(args.values, np.random.default_rng(0))
+    print(f'{len(years):,} values')
+
+    start = time.perf_counter()
+    expected = years.apply(categorize_experience)
+    apply_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = categorize_experience_vectorized(years)
+    vectorized_time = time.perf_counter() - start
+
+    assert result.astype(str).equals(expected)
+    print(f'.apply(categorize_experience):    {apply_time:.2f} s')
+    print(f'categorize_experience_vectorized: {vectorized_time:.2f} s  ({apply_time / vectorized_time:.0f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark CityGrowth.clean_data and compute_weighted_avg_growth (distinct-value
+percent parsing, one groupby.agg) against the previous implementation on a
+synthetic places table.
+
+Run from the 02-pandas-lerner folder:
+    python benchmarks/bench_utils_11.py --rows 500000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add the parent directory (02-pandas-lerner) to sys.path to import utils_11
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils_11 import CityGrowth
+
+GROWTH = 'growth_from_2000_to_2013'
+
+
+def make_places(rows, rng, states=50):
+    """Raw places in the cities.json layout, growth as strings such as '4.8%'."""
+    growth = np.round(rng.normal(10, 20, rows), 1).astype(str).astype(object) + '%'
+    growth[rng.random(rows) < 0.02] = ''
+    growth[rng.random(rows) < 0.02] = np.nan
+    return pd.DataFrame({
+        'city': [f'City {i}' for i in range(rows)],
+        GROWTH: growth,
+        'population': rng.integers(100, 1_000_000, rows),
+        'state': rng.choice([f'State {i:02d}' for i in range(states)], rows),
+    })
+
+
+def clean_data_old(raw_data):
+    """The previous CityGrowth.clean_data."""
+    cleaned = raw_data[~raw_data[GROWTH].isna() & (raw_data[GROWTH] != '')].copy()
+    cleaned[GROWTH] = cleaned[GROWTH].str.rstrip('%').astype(float) / 100
+    return cleaned
+
+
+def compute_weighted_avg_growth_old(data):
+    """The previous CityGrowth.compute_weighted_avg_growth."""
+    wg_data = data.copy()
+    wg_data['weighted_growth'] = wg_data[GROWTH] * wg_data['population']
+    grouped = wg_data.groupby('state')
+    total_weighted = grouped['weighted_growth'].sum()
+    total_pop = grouped['population'].sum()
+    return pd.DataFrame({
+        'total_weighted_growth': total_weighted,
+        'total_population': total_pop,
+        'weighted_avg_growth': total_weighted / total_pop
+    })
+
+
+def best_of(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=500_000)
+    args = parser.parse_args()
+
+    raw = make_places(args.rows, np.random.default_rng(0))
+    print(f'{len(raw):,} places')
+
+    def old():
+        data = clean_data_old(raw)
+        return data, compute_weighted_avg_growth_old(data)
+
+    def new():
+        city_growth = CityGrowth(raw)
+        return city_growth.data, city_growth.state_growth
+
+    (old_data, old_growth), old_time = best_of(old)
+    (new_data, new_growth), new_time = best_of(new)
+    assert old_data.equals(new_data)
+    assert old_growth.equals(new_growth)
+
+    print(f'previous implementation: {old_time:.3f} s')
+    print(f'CityGrowth:              {new_time:.3f} s  ({old_time / new_time:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark OECDUtils.get_oecd_countries (n-gram indexed SubstringMatcher) against
+the previous nested loop on synthetic name lists.
+
+Run from the 02-pandas-lerner folder:
+    python benchmarks/bench_utils_midproject.py --names 50000
+"""
+
+import argparse
+import string
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add the parent directory (02-pandas-lerner) to sys.path to import utils_midproject
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils_midproject import OECDUtils
+
+
+def make_names(count, rng, min_len=4, max_len=14):
+    """Random capitalized names, some of them made of two words."""
+    letters = np.array(list(string.ascii_lowercase))
+    names = []
+    for length in rng.integers(min_len, max_len, count):
+        name = ''.join(rng.choice(letters, length)).title()
+        if rng.random() < 0.3:
+            name = f'{name} {"".join(rng.choice(letters, 5)).title()}'
+        names.append(name)
+    return names
+
+
+def nested_loop(countries_oecd, countries_so, country_to_exclude):
+    """The previous implementation of get_oecd_countries."""
+    oecd_countries_list = []
+    for country_oecd in countries_oecd:
+        for country_so in countries_so:
+            if country_oecd.lower() in country_so.lower():
+                if country_so.lower() == country_to_exclude.lower():
+                    continue
+                oecd_countries_list.append(country_so)
+    return oecd_countries_list
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--names', type=int, default=50_000, help='names in each list')
+    parser.add_argument('--sample', type=int, default=500,
+                        help='OECD names used to time (and extrapolate) the nested loop')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    so_names = make_names(args.names, rng)
+    # Short OECD names, some taken from inside the other list so that there are matches
+    oecd_names = [name[1:5] if rng.random() < 0.5 else name[:6]
+                  for name in make_names(args.names, rng)]
+    df_oecd = pd.DataFrame({'country': oecd_names})
+    df_so = pd.DataFrame({'Country': so_names})
+
+    start = time.perf_counter()
+    utils = OECDUtils(df_oecd=df_oecd, df_so=df_so)
+    indexed_time = time.perf_counter() - start
+    print(f'{args.names:,} x {args.names:,} names, {len(utils.oecd_countries_list):,} matches')
+    print(f'indexed matcher: {indexed_time:.2f} s')
+
+    # The nested loop is quadratic: time it on a sample of the OECD names
+    sample = df_oecd['country'].unique()[:args.sample]
+    start = time.perf_counter()
+    expected = nested_loop(sample, df_so['Country'].unique(), 'North Korea')
+    loop_time = time.perf_counter() - start
+    estimate = loop_time * df_oecd['country'].nunique() / len(sample)
+    print(f'nested loop:     {estimate:.2f} s (extrapolated from {len(sample)} names)')
+
+    sample_utils = OECDUtils(df_oecd=pd.DataFrame({'country': sample}), df_so=df_so)
+    assert sample_utils.oecd_countries_list == expected
+
+
+if __name__ == '__main__':
+    main()
@@ -4,38 +4,59 @@ import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
 import numpy as np
+import os
+import sys
+from pathlib import Path
+
+# utils_common lives at the repository root, searched after the folder's own modules
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+from utils_common import read_files_parallel, load_cached
 
 class CityGrowth:
-    def __init__(self, data, states=None):
+    def __init__(self, data, states=None, bins=20):
         """
-        Initialize with the raw cities dataframe and two states.
+        Initialize with the raw cities dataframe and the states to compare.
         data: raw pandas DataFrame from cities.json
-        states: list of two state names, e.g., ['Texas', 'Michigan']
+        states: list of state names, e.g., ['Texas', 'Michigan', 'Ohio']
+        bins: number of growth bins over the whole range, or an array of bin edges
         """
         
+        self.states = None
         if states is not None:
-            if len(states) != 2:
-                raise ValueError("Exactly two states must be provided.")
-            self.states = states
+            if len(states) == 0:
+                raise ValueError("At least one state must be provided.")
+            self.states = list(states)
 
         self.raw_data = data
         self.growth_col = 'growth_from_2000_to_2013'
         self.data = self.clean_data()
         self.state_growth = self.compute_weighted_avg_growth()
+        self.build_state_index()
+        self.set_bins(bins)
+
+    @staticmethod
+    def parse_percent(values):
+        """
+        Convert percent strings such as '4.8%' to fractions (0.048), NaN and '' become NaN.
+        Every distinct string is parsed only once.
+        """
+        codes, uniques = pd.factorize(values)
+        uniques = pd.Series(uniques, dtype=object).str.rstrip('%')  # Remove trailing '%'
+        parsed = uniques.where(uniques != '').astype(float).to_numpy() / 100
+        # Code -1 (NaN) picks the NaN appended at the end
+        return np.append(parsed, np.nan)[codes]
 
     def clean_data(self):
         """
         Clean the data: remove NaN/empty growth values, convert growth to numeric.
         """
-        growth = self.growth_col
-        # Remove rows with NaN or empty growth values
-        cleaned = self.raw_data[~self.raw_data[growth].isna() & (self.raw_data[growth] != '')].copy()
-        # Convert growth column to numeric
-        cleaned[growth] = (
-            cleaned[growth]
-            .str.rstrip('%')  # Remove trailing '%'
-            .astype(float) / 100  # Convert to float and divide by 100
-        )
+        growth = self.parse_percent(self.raw_data[self.growth_col])
+        # Remove rows with NaN or empty growth values, take() already returns a new frame
+        rows = np.flatnonzero(~np.isnan(growth))
+        cleaned = self.raw_data.take(rows)
+        cleaned[self.growth_col] = growth[rows]
         return cleaned
 
     def compute_weighted_avg_growth(self):
@@ -43,56 +64,141 @@ class CityGrowth:
         Compute weighted average growth per state.
         Returns a DataFrame with total_weighted_growth, total_population, and weighted_avg_growth.
         """
-        growth_col = self.growth_col
-        # Create weighted growth column
-        wg_data = self.data.copy()
-        wg_data['weighted_growth'] = wg_data[growth_col] * wg_data['population']
+        population = self.data['population'].to_numpy()
+        # Only the three columns we need, built from numpy arrays
+        wg_data = pd.DataFrame({
+            'state': self.data['state'].to_numpy(),
+            'weighted_growth': self.data[self.growth_col].to_numpy() * population,
+            'population': population
+        })
 
-        # Group and sum
-        grouped = wg_data.groupby('state')
-        total_weighted = grouped['weighted_growth'].sum()
-        total_pop = grouped['population'].sum()
+        # Group and sum in a single pass
+        state_growth = wg_data.groupby('state').agg(
+            total_weighted_growth=('weighted_growth', 'sum'),
+            total_population=('population', 'sum')
+        )
 
         # Compute weighted average
-        weighted_avg_growth = total_weighted / total_pop
+        state_growth['weighted_avg_growth'] = (
+            state_growth['total_weighted_growth'] / state_growth['total_population']
+        )
+        return state_growth
+
+    def build_state_index(self):
+        """
+        Sort growth by state and growth once. Each state is a contiguous slice
+        of self.sorted_growth, given by self.state_slices[state].
+        Cities without a state are left out, as groupby leaves them out.
+        """
+        state_codes, states = pd.factorize(self.data['state'], sort=True)
+        growth = self.data[self.growth_col].to_numpy()
+        known = state_codes >= 0  # factorize gives -1 to a missing state
+        state_codes, growth = state_codes[known], growth[known]
+        order = np.lexsort((growth, state_codes))
+        self.sorted_growth = growth[order]
+        self.sorted_state_codes = state_codes[order]
 
-        # Combine into DataFrame
-        state_growth = pd.DataFrame({
-            'total_weighted_growth': total_weighted,
-            'total_population': total_pop,
-            'weighted_avg_growth': weighted_avg_growth
+        bounds = np.concatenate([[0], np.cumsum(np.bincount(state_codes, minlength=len(states)))])
+        self.state_slices = {
+            state: slice(start, stop)
+            for state, start, stop in zip(states, bounds[:-1], bounds[1:])
+        }
+
+    def select_growth(self, states=None):
+        """
+        Return the growth of the cities in the given states, sorted by state and growth.
+        Each state is a slice of the sorted array, the data is not filtered.
+        """
+        states = sorted(state for state in self._get_states(states) if state in self.state_slices)
+        slices = [self.sorted_growth[self.state_slices[state]] for state in states]
+        return pd.DataFrame({
+            'state': np.repeat(states, [len(values) for values in slices]),
+            self.growth_col: np.concatenate(slices) if slices else np.array([])
         })
-        return state_growth
 
-    def plot_growth(self, bins=20, alpha=0.5, figsize=(8, 4), verbose=False):
+    def _get_states(self, states=None):
+        """
+        The given states, or the ones passed to __init__.
+        """
+        states = states or self.states
+        if not states:
+            raise ValueError("No states to compare: pass states, here or to __init__.")
+        return list(states)
+
+    def set_bins(self, bins=20):
+        """
+        Precompute the histograms used by plot_growth.
+        bins: number of equal-width bins over the whole growth range, or an array of bin edges.
+        """
+        self.bin_edges, self.state_histograms = self.compute_histograms(bins)
+
+    def compute_histograms(self, bins=20):
+        """
+        Count the cities of every state in each growth bin.
+        Returns the bin edges and a DataFrame of counts (states x bins).
+        """
+        bin_edges = np.histogram_bin_edges(self.sorted_growth, bins=bins)
+        n_bins = len(bin_edges) - 1
+        n_states = len(self.state_slices)
+
+        # Bin of every value, the last bin includes its right edge as in np.histogram
+        bin_idx = np.searchsorted(bin_edges, self.sorted_growth, side='right') - 1
+        bin_idx[self.sorted_growth == bin_edges[-1]] = n_bins - 1
+        inside = (bin_idx >= 0) & (bin_idx < n_bins)
+
+        counts = np.bincount(
+            self.sorted_state_codes[inside] * n_bins + bin_idx[inside],
+            minlength=n_states * n_bins
+        )
+        state_histograms = pd.DataFrame(
+            counts.reshape(n_states, n_bins),
+            index=pd.Index(list(self.state_slices), name='state')
+        )
+        return bin_edges, state_histograms
+
+    def plot_growth(self, bins=None, alpha=0.5, figsize=(8, 4), verbose=False, *, states=None):
         """
-        Plot overlapping histograms of growth rates for the two states.
+        Plot overlapping histograms of growth rates for the given states (self.states by default).
+        The histograms are precomputed with the bins given to __init__/set_bins. Passing bins
+        recomputes them for this plot only, the stored histograms are left unchanged.
         If verbose=True, print the weighted average growth for each state.
         """
+        states = self._get_states(states)
+        if bins is None:
+            bin_edges, state_histograms = self.bin_edges, self.state_histograms
+        else:
+            bin_edges, state_histograms = self.compute_histograms(bins)
+
         if verbose:
             # state_growth = self.compute_weighted_avg_growth()
             state_growth = self.state_growth
-            for state in self.states:
+            for state in states:
                 if state in state_growth.index:
                     avg_growth = state_growth.loc[state, 'weighted_avg_growth']
                     print(f"Weighted average growth for {state}: {avg_growth:.4f}")
                 else:
                     print(f"No data for {state}")
 
-        # Filter data for the two states
-        cities_filtered = self.data[self.data['state'].isin(self.states)].copy()
-        cities_filtered = cities_filtered.sort_values(by=['state', self.growth_col])
+        # One row per state and bin, weighted by the precomputed counts
+        histograms = state_histograms.loc[sorted(set(states) & set(self.state_slices))]
+        n_bins = histograms.shape[1]
+        bin_counts = pd.DataFrame({
+            'state': np.repeat(histograms.index, n_bins),
+            self.growth_col: np.tile(bin_edges[:-1], len(histograms)),
+            'count': histograms.to_numpy().ravel()
+        })
 
         # Plot
         plt.figure(figsize=figsize)
         sns.histplot(
-            data=cities_filtered,
+            data=bin_counts,
             x=self.growth_col,
+            weights='count',
             hue='state',
-            bins=bins,
+            bins=bin_edges.tolist(),
             alpha=alpha
         )
-        plt.title(f'Growth Rates: {self.states[0]} vs {self.states[1]}')
+        plt.title(f'Growth Rates: {" vs ".join(states)}')
         plt.show()
 
     def plot_weighted_avg_growth(self, figsize=(6, 4)):
@@ -227,10 +333,17 @@ class WeatherPlotter:
         plt.show()
 
 class NYCTaxiPlotter:
-    def __init__(self):
+    def __init__(self, streaming=False, chunksize=1_000_000, executor='thread',
+                 max_workers=None, verbose=False, cache_dir=None):
         """
         Initialize with filenames, usecols, and parse_dates.
         Loads and combines the taxi data into self.taxi.
+        streaming: if True, read each file in chunks of `chunksize` rows, filter and
+        downcast every chunk, and keep only the surviving rows.
+        executor: 'thread', 'process' or 'serial', how the files are read (see utils_common).
+        verbose: if True, print the parse time per file and the memory used by the load
+        (see _measure_load_memory).
+        cache_dir: if given, cache the cleaned data there as Parquet (see utils_common).
         """
         # Set defaults
         self.filenames = ['data/nyc_taxi_2019-01.csv', 'data/nyc_taxi_2019-07.csv',
@@ -245,23 +358,200 @@ class NYCTaxiPlotter:
         self.years = [2019, 2020]
         self.months = [1, 7]  # January and July 
 
+        # Compact dtypes used by the streaming loader
+        self.fare_cols = ['fare_amount', 'extra', 'mta_tax', 'tip_amount', 'tolls_amount',
+                          'improvement_surcharge', 'total_amount', 'congestion_surcharge']
+        self.dtypes = {col: 'float32' for col in self.fare_cols}
+        self.passenger_dtype = 'UInt8'  # Nullable, passenger_count has missing values
+
+        self.streaming = streaming
+        self.chunksize = chunksize
+        self.executor = executor
+        self.max_workers = max_workers
+        self.verbose = verbose
+        self.cache_dir = cache_dir
+        self.load_times = {}  # Stays empty when the data comes from the cache
+
+        # Memory before the load, the load is measured from there
+        self._reset_peak_rss()
+        memory_before = (self._get_current_rss_mb(), self._get_peak_rss_mb(),
+                         self._get_peak_rss_mb(children=True))
+
         # Load and combine the taxi data
-        self.taxi = self._load_and_combine()
+        loader = self._load_streaming if self.streaming else self._load_and_combine
+        self.taxi = load_cached(loader, self.filenames, self.cache_dir,
+                                usecols=self.usecols, years=self.years, months=self.months)
+
+        # Aggregate cube shared by the plot methods that don't need raw rows
+        self.cube_cols = self.fare_cols + ['trip_distance']
+        self.cube = self._build_cube()
+
+        # Memory used by the load (files and cube), to size the workers
+        self.peak_rss_mb, self.worker_peak_rss_mb = self._measure_load_memory(memory_before)
+
+        if verbose and self.peak_rss_mb is not None:
+            print(f"Loaded {len(self.taxi):,} rides, peak RSS of the load: {self.peak_rss_mb:.1f} MB")
+            if self.worker_peak_rss_mb is not None:
+                print(f"Peak RSS of the largest worker process: {self.worker_peak_rss_mb:.1f} MB")
 
     def _load_and_combine(self):
         """
         Load each taxi CSV file and concatenate into a single DataFrame.
         """
-        dfs = [
-            pd.read_csv(filename, 
-                        usecols=self.usecols, 
-                        parse_dates=self.date_cols)
-            for filename in self.filenames
-        ]
+        dfs, self.load_times = read_files_parallel(self.filenames,
+                                                   executor=self.executor,
+                                                   max_workers=self.max_workers,
+                                                   verbose=self.verbose,
+                                                   usecols=self.usecols,
+                                                   parse_dates=self.date_cols)
         
         combined = pd.concat(dfs, ignore_index=True)
         return self._clean_data(combined)
 
+    def _load_streaming(self):
+        """
+        Read each taxi CSV file in chunks, keeping only the rows that survive the date
+        filter, with float32 fare columns and a compact passenger_count.
+        """
+        dfs, self.load_times = read_files_parallel(self.filenames,
+                                                   reader=self._read_file_streaming,
+                                                   executor=self.executor,
+                                                   max_workers=self.max_workers,
+                                                   verbose=self.verbose)
+
+        return pd.concat(dfs, ignore_index=True)
+
+    def _read_file_streaming(self, filename):
+        """
+        Read one taxi CSV file chunk by chunk and return the filtered, downcast rows.
+        """
+        pieces = []
+        reader = pd.read_csv(filename,
+                             usecols=self.usecols,
+                             parse_dates=self.date_cols,
+                             dtype=self.dtypes,
+                             chunksize=self.chunksize)
+        for chunk in reader:
+            chunk = self._clean_data(chunk)
+            chunk['passenger_count'] = chunk['passenger_count'].astype(self.passenger_dtype)
+            pieces.append(chunk)
+
+        return pd.concat(pieces, ignore_index=True)
+
+    def _build_cube(self):
+        """
+        Aggregate the rides once by year x month x weekday x passenger_count.
+        Columns are a MultiIndex (stat, column) with stats 'sum', 'count' (non-null
+        values, plus 'rides' for the number of rows) and 'sumsq' (sum of squares).
+        """
+        dates = self.taxi[self.date_col]
+        keys = [
+            dates.dt.year.rename('year'),
+            dates.dt.month.rename('month'),
+            dates.dt.dayofweek.rename('weekday'),  # Monday is 0
+            self.taxi['passenger_count']
+        ]
+        # Factorize the keys once, then aggregate column by column on the group ids
+        grouped = self.taxi.groupby(keys, dropna=False)
+        group_ids = grouped.ngroup().to_numpy()
+        rides = grouped.size()
+
+        sums, counts, sumsqs = {}, {}, {}
+        for col in self.cube_cols:
+            # Sum in float64 even if the columns were downcast to float32. Only one
+            # column is upcast at a time, so the frame is never copied as a whole.
+            values = self.taxi[col].astype('float64')
+            by_group = values.groupby(group_ids)
+            sums[col] = by_group.sum().to_numpy()
+            counts[col] = by_group.count().to_numpy()
+            sumsqs[col] = (values ** 2).groupby(group_ids).sum().to_numpy()
+        counts['rides'] = rides.to_numpy()
+
+        cube = pd.concat({
+            'sum': pd.DataFrame(sums, index=rides.index),
+            'count': pd.DataFrame(counts, index=rides.index),
+            'sumsq': pd.DataFrame(sumsqs, index=rides.index)
+        }, axis=1)
+        return cube
+
+    def _from_cube(self, stat, by, year=None, month=None):
+        """
+        Roll the cube up to the `by` levels for one stat, optionally for a single year/month.
+        """
+        cube = self.cube[stat]
+        if year is not None:
+            cube = cube[cube.index.get_level_values('year') == year]
+        if month is not None:
+            cube = cube[cube.index.get_level_values('month') == month]
+        return cube.groupby(level=by).sum()
+
+    def _measure_load_memory(self, before):
+        """
+        Return the memory used by the load in MB, as (peak_rss_mb, worker_peak_rss_mb).
+        before: (current RSS, peak RSS, peak RSS of the children) taken before the load.
+        peak_rss_mb is the peak RSS of this process after the load minus its RSS before
+        (minus its peak before where the current RSS can't be read). The peak is a
+        high-water mark over the life of the process. On Linux it is reset before the
+        load; elsewhere, if the process peaked higher before the load (e.g. in earlier
+        notebook cells), this is only an upper bound.
+        worker_peak_rss_mb is, with executor='process', the peak RSS of the largest worker.
+        It is None when unknown, e.g. when no worker went above an earlier child process.
+        """
+        rss_before, peak_before, children_before = before
+        peak_after = self._get_peak_rss_mb()
+        if peak_after is None:
+            return None, None
+        peak_rss_mb = peak_after - (rss_before if rss_before is not None else peak_before)
+
+        worker_peak_rss_mb = None
+        if self.executor == 'process':
+            children_after = self._get_peak_rss_mb(children=True)
+            if children_after > children_before:
+                worker_peak_rss_mb = children_after
+        return peak_rss_mb, worker_peak_rss_mb
+
+    @staticmethod
+    def _reset_peak_rss():
+        """
+        Reset the peak resident set size of the process to its current size, so that it
+        covers what runs next only. Linux only, does nothing elsewhere.
+        """
+        try:
+            with open('/proc/self/clear_refs', 'w') as f:
+                f.write('5')
+        except OSError:
+            pass
+
+    @staticmethod
+    def _get_current_rss_mb():
+        """
+        Return the current resident set size of the process in MB (None if unknown).
+        Read from /proc, so only available on Linux.
+        """
+        try:
+            with open('/proc/self/statm') as f:
+                pages = int(f.read().split()[1])
+        except (OSError, ValueError, IndexError):
+            return None
+        return pages * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+
+    @staticmethod
+    def _get_peak_rss_mb(children=False):
+        """
+        Return the peak resident set size in MB (None if unknown), of the current process
+        or, with children=True, of the largest child process that has finished.
+        """
+        try:
+            import resource
+        except ImportError:  # Not available on Windows
+            return None
+        who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+        peak = resource.getrusage(who).ru_maxrss
+        # Linux reports kilobytes, macOS reports bytes
+        if sys.platform == 'darwin':
+            return peak / 1024 ** 2
+        return peak / 1024
+
     def _clean_data(self, df):
         """
         Clean the data by keeping only rides in months 1 (January) or 7 (July).
@@ -275,10 +565,8 @@ class NYCTaxiPlotter:
         """
         Plot bar plot of rides by year and month    .
         """
-        df = self.taxi.copy()
-        df['year'] = df[self.date_cols[0]].dt.year
-        df['month'] = df[self.date_cols[0]].dt.month.map({1: 'January', 7: 'July'})
-        rides = df.groupby(['year', 'month']).size().reset_index(name='ride_count')
+        rides = self._from_cube('count', ['year', 'month'])['rides'].reset_index(name='ride_count')
+        rides['month'] = rides['month'].map({1: 'January', 7: 'July'})
         plt.figure(figsize=(6, 3))
         sns.barplot(data=rides, x='month', y='ride_count', hue='year', 
                     palette={2019: 'skyblue', 2020: 'salmon'})
@@ -295,10 +583,8 @@ class NYCTaxiPlotter:
         """
 
         # Prepare data for plotting
-        df = self.taxi.copy()
-        df['year'] = df[self.date_cols[0]].dt.year
-        df['month'] = df[self.date_cols[0]].dt.month.map({1: 'January', 7: 'July'})
-        amounts = df.groupby(['year', 'month'])['total_amount'].sum().reset_index(name='total_paid')
+        amounts = self._from_cube('sum', ['year', 'month'])['total_amount'].reset_index(name='total_paid')
+        amounts['month'] = amounts['month'].map({1: 'January', 7: 'July'})
 
         # Plot bar plot of total amount paid
         plt.figure(figsize=(6, 3))
@@ -315,13 +601,10 @@ class NYCTaxiPlotter:
         """
         Plot stacked bar of fare components by year and month.
         """
-        df = self.taxi.copy()
-        df['year'] = df[self.date_cols[0]].dt.year
-        df['month'] = df[self.date_cols[0]].dt.month.map({1: 'Jan', 7: 'Jul'})
-        
         # Aggregate sums per year/month
         fair_components = ['fare_amount', 'extra', 'mta_tax', 'tip_amount', 'tolls_amount']
-        components = df.groupby(['year', 'month'])[fair_components].sum().reset_index()
+        components = self._from_cube('sum', ['year', 'month'])[fair_components].reset_index()
+        components['month'] = components['month'].map({1: 'Jan', 7: 'Jul'})
         components[fair_components] /= 1e6  # Scale down for better readability
         components = components.set_index(['year', 'month'])
         print(components)
@@ -346,9 +629,9 @@ class NYCTaxiPlotter:
         """
         Plot fare amount per passenger count.
         """
-        df = self.taxi.copy()
-        df['fare_per_passenger'] = df['fare_amount'] / df['passenger_count']
-        fare_per_passenger = df['passenger_count'].value_counts().sort_index() / 1e6  # Scale down for better readability
+        # Grouping by level drops missing passenger counts, as value_counts() does
+        rides = self.cube['count']['rides'].groupby(level='passenger_count').sum()
+        fare_per_passenger = rides / 1e6  # Scale down for better readability
 
         plt.figure(figsize=figsize)
         sns.barplot(x=fare_per_passenger.index, y=fare_per_passenger.values, color='green', alpha=0.6)
@@ -379,19 +662,14 @@ class NYCTaxiPlotter:
         Create a bar plot, showing the average distance traveled per day of the week in July 2020.
         The x axis shows the name of each day.
         """
-        # Maps day numbers to names and vice versa
+        # Maps day numbers to names
         numday_to_name = {0: 'Monday', 1: 'Tuesday', 2: 'Wednesday', 3: 'Thursday',
                            4: 'Friday', 5: 'Saturday', 6: 'Sunday'}
-        name_to_numday = {v: k for k, v in numday_to_name.items()}
 
-        # Filter data for the specified month and year
-        df = self.taxi.copy()
-        mask = (df[self.date_col].dt.year == year) & (df[self.date_col].dt.month == month)
-        df = df[mask].copy()
-
-        # Compute average distance per day of the week
-        df['day_of_week'] = df[self.date_col].dt.day_name().map(name_to_numday)
-        avg_distance = df.groupby('day_of_week')['trip_distance'].mean().sort_index()
+        # Compute average distance per day of the week for the specified month and year
+        sums = self._from_cube('sum', 'weekday', year=year, month=month)['trip_distance']
+        counts = self._from_cube('count', 'weekday', year=year, month=month)['trip_distance']
+        avg_distance = (sums / counts).sort_index()
         avg_distance.index = avg_distance.index.map(numday_to_name)
         avg_distance.name = 'avg_distance'
 
@@ -546,10 +824,14 @@ class CorrFinder:
 
 class NYCTaxiPlotterSeaborn:
 
-    def __init__(self, both_years=False, trip_length=False):
+    def __init__(self, both_years=False, trip_length=False, executor='thread',
+                 max_workers=None, verbose=False, cache_dir=None):
         """
         Initialize with filenames, usecols, and parse_dates for 2020 data only.
         Loads, cleans, and subsets the taxi data into self.taxi and self.taxi_toy.
+        executor: 'thread', 'process' or 'serial', how the files are read (see utils_common).
+        verbose: if True, print the parse time per file.
+        cache_dir: if given, cache the cleaned data there as Parquet (see utils_common).
         """
         # Set defaults for 2020 only
         self.filenames = ['data/nyc_taxi_2020-01.csv', 'data/nyc_taxi_2020-07.csv']
@@ -567,8 +849,15 @@ class NYCTaxiPlotterSeaborn:
             self.years = [2019, 2020]
         self.months = [1, 7]  # January and July
 
+        self.executor = executor
+        self.max_workers = max_workers
+        self.verbose = verbose
+        self.cache_dir = cache_dir
+        self.load_times = {}  # Stays empty when the data comes from the cache
+
         # Load and combine the taxi data
-        self.taxi = self._load_and_combine()
+        self.taxi = load_cached(self._load_and_combine, self.filenames, self.cache_dir,
+                                usecols=self.usecols, years=self.years, months=self.months)
 
         # Create tiny subset
         np.random.seed(0)
@@ -579,12 +868,12 @@ class NYCTaxiPlotterSeaborn:
         """
         Load each taxi CSV file and concatenate into a single DataFrame.
         """
-        dfs = [
-            pd.read_csv(filename, 
-                        usecols=self.usecols, 
-                        parse_dates=self.date_cols)
-            for filename in self.filenames
-        ]
+        dfs, self.load_times = read_files_parallel(self.filenames,
+                                                   executor=self.executor,
+                                                   max_workers=self.max_workers,
+                                                   verbose=self.verbose,
+                                                   usecols=self.usecols,
+                                                   parse_dates=self.date_cols)
         
         combined = pd.concat(dfs, ignore_index=True)
         combined = self._clean_data(combined)
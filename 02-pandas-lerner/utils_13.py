@@ -6,9 +6,21 @@ sns.set_theme()
 
 import pandas as pd
 
+import sys
+from pathlib import Path
+
+# utils_common lives at the repository root, searched after the folder's own modules
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+from utils_common import load_cached
+
 class CollegeScorecard:
 
-    def __init__(self):
+    def __init__(self, cache_dir=None):
+        # Cache the parsed files as Parquet in cache_dir (see utils_common)
+        self.cache_dir = cache_dir
+
         # Default file paths (adjusted to 'data/' as per your setup)
         self.institutions_filename = 'data/Most-Recent-Cohorts-Institution.csv'
         self.fields_filename = 'data/FieldOfStudyData1718_1819_PP.csv'
@@ -23,8 +35,10 @@ class CollegeScorecard:
         self.fields_usecols = ['OPEID6', 'INSTNM', 'CREDDESC', 'CIPDESC', 'CONTROL']
         
         # Load the DataFrames
-        self.univers = pd.read_csv(self.institutions_filename, usecols=self.institutions_usecols)
-        self.fields = pd.read_csv(self.fields_filename, usecols=self.fields_usecols)
+        self.univers = load_cached(self._load_univers, [self.institutions_filename], self.cache_dir,
+                                   usecols=self.institutions_usecols)
+        self.fields = load_cached(self._load_fields, [self.fields_filename], self.cache_dir,
+                                  usecols=self.fields_usecols)
 
         ################################################################################
         ########################### University columns names ###########################
@@ -92,6 +106,12 @@ class CollegeScorecard:
                         'Cornell University',
                         'Princeton University']
 
+    def _load_univers(self):
+        return pd.read_csv(self.institutions_filename, usecols=self.institutions_usecols)
+
+    def _load_fields(self):
+        return pd.read_csv(self.fields_filename, usecols=self.fields_usecols)
+
     def _get_undergrad_univers(self, return_type='df'):
         """Get universities that offer undergraduate programs (bachelor's degrees)."""
         undergrad_mask = self.fields[self.fields_degree_col] == self.BATCHELORS
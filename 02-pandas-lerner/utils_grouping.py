@@ -1,6 +1,15 @@
 import pandas as pd
 import os
 
+import sys
+from pathlib import Path
+
+# utils_common lives at the repository root, searched after the folder's own modules
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+from utils_common import read_files_parallel, load_cached
+
 class WeatherDataManager:
     def __init__(self, 
                  data_folder='data', 
@@ -14,12 +23,23 @@ class WeatherDataManager:
                      'los+angeles,ca.csv', 
                      'chicago,il.csv'
                  ],
-                 usecols=[0, 1, 2]
+                 usecols=[0, 1, 2],
+                 executor='thread',  # 'thread', 'process' or 'serial'
+                 max_workers=None,
+                 verbose=False,  # Print the parse time per file
+                 cache_dir=None  # Cache the combined data as Parquet (see utils_common)
                  ):
         self.data_folder = data_folder
         self.filenames = filenames
         self.usecols = usecols
-        self.weather = self.load_weather_data()
+        self.executor = executor
+        self.max_workers = max_workers
+        self.verbose = verbose
+        self.cache_dir = cache_dir
+        self.load_times = {}  # Stays empty when the data comes from the cache
+        file_paths = [os.path.join(self.data_folder, fname) for fname in self.filenames]
+        self.weather = load_cached(self.load_weather_data, file_paths, self.cache_dir,
+                                   usecols=self.usecols)
 
     def _extract_city_state(self, filename):
         # Extract city  from the filename and capitalize it
@@ -34,12 +54,17 @@ class WeatherDataManager:
         return city, state
 
     def load_weather_data(self):
+        # Read only first three columns, all files at once
+        file_paths = [os.path.join(self.data_folder, fname) for fname in self.filenames]
+        frames, self.load_times = read_files_parallel(file_paths,
+                                                      executor=self.executor,
+                                                      max_workers=self.max_workers,
+                                                      verbose=self.verbose,
+                                                      usecols=self.usecols,
+                                                      parse_dates=[0])
+
         dfs = []
-        for fname in self.filenames:
-            
-            # Read only first three columns
-            file_path = os.path.join(self.data_folder, fname)
-            df = pd.read_csv(file_path, usecols=self.usecols, parse_dates=[0])
+        for fname, df in zip(self.filenames, frames):
             df.columns = ['date_time', 'max_temp', 'min_temp']
 
             # Add city and state columns
@@ -1,5 +1,50 @@
 import pandas as pd
 import numpy as np
+from collections import defaultdict
+
+class SubstringMatcher:
+    """
+    Case-insensitive substring search over a fixed list of names.
+    Names are lowercased once and indexed by their character n-grams, so a query
+    only checks the names that contain every n-gram of the query.
+    """
+
+    def __init__(self, names, n=3, exclude=None):
+        """
+        names: candidate names, matches are returned in this order.
+        n: n-gram length of the index; shorter queries fall back to a scan.
+        exclude: a name (any case) that is never returned.
+        """
+        self.n = n
+        excluded = exclude.lower() if exclude is not None else None
+        self.names = []
+        self.lowered = []
+        for name in names:
+            if name.lower() != excluded:
+                self.names.append(name)
+                self.lowered.append(name.lower())
+
+        # n-gram -> set of positions of the names containing it
+        self.index = defaultdict(set)
+        for position, name in enumerate(self.lowered):
+            for i in range(len(name) - n + 1):
+                self.index[name[i:i + n]].add(position)
+
+    def find(self, query):
+        """Return the names containing `query` (case-insensitive), in their original order."""
+        query = query.lower()
+        if len(query) < self.n:
+            candidates = range(len(self.lowered))
+        else:
+            postings = [self.index.get(query[i:i + self.n], set())
+                        for i in range(len(query) - self.n + 1)]
+            postings.sort(key=len)
+            candidates = sorted(set.intersection(*postings))
+
+        # The n-grams only narrow the candidates down, the substring check decides
+        return [self.names[position] for position in candidates
+                if query in self.lowered[position]]
+
 
 class OECDUtils:
     """Utility class for handling OECD data."""
@@ -22,14 +67,11 @@ class OECDUtils:
         """Creates a list of OECD countries from df_so using df_oecd"""
         countries_oecd = self.df_oecd[self.country_column_oecd].unique()
         countries_so = self.df_so[self.country_column_so].unique()
+        matcher = SubstringMatcher(countries_so, exclude=self.country_to_exclude)
         oecd_countries_list = []
         for country_oecd in countries_oecd:
-            for country_so in countries_so:
-                if country_oecd.lower() in country_so.lower():
-                    if country_so.lower() == self.country_to_exclude.lower():
-                        continue
-                    # print(f"Match found: {country_oecd} in {country_so}")
-                    oecd_countries_list.append(country_so)
+            # Stack Overflow countries containing the OECD country name
+            oecd_countries_list.extend(matcher.find(country_oecd))
         return oecd_countries_list 
     
 
@@ -57,23 +99,41 @@ class MultiIndexUtils:
                     'use.python.most',
                     'years.of.coding'
                     ]
+    # Set version of general_columns for constant-time lookups
+    general_columns_set = frozenset(general_columns)
+
+    # Column names (tuple) -> MultiIndex, shared by all instances with the same schema
+    _multi_index_cache = {}
     
     def __init__(self, df=None):
         self.df = df
     
     def column_multi_name(self, column_name):
-        if column_name in MultiIndexUtils.general_columns:
+        if column_name in MultiIndexUtils.general_columns_set:
             return ('general', column_name)
         else:
             first, rest = column_name.rsplit('.', 1)
             return (first, rest)
+
+    def get_multi_index(self, columns):
+        """Return the MultiIndex for the given column names, built once per schema."""
+        key = tuple(columns)
+        multi_index = MultiIndexUtils._multi_index_cache.get(key)
+        if multi_index is None:
+            multi_index = pd.MultiIndex.from_tuples(
+                [self.column_multi_name(col) for col in key]
+            )
+            MultiIndexUtils._multi_index_cache[key] = multi_index
+        return multi_index
         
-    def with_multi_index_columns(self):
-        """Return a new DataFrame with MultiIndex columns."""
-        new_df = self.df.copy()
-        new_df.columns = pd.MultiIndex.from_tuples(
-            [self.column_multi_name(col) for col in new_df.columns]
-        )
+    def with_multi_index_columns(self, copy=True):
+        """
+        Return a new DataFrame with MultiIndex columns.
+        copy: if False, make a shallow copy that shares the data with self.df
+        instead of duplicating it, only the column labels differ.
+        """
+        new_df = self.df.copy(deep=copy)
+        new_df.columns = self.get_multi_index(new_df.columns)
         return new_df
     
 # A function to categorize the years of experience
@@ -87,4 +147,27 @@ def categorize_experience(years):
     elif 6 <= years <= 10:
         return '6–10 years'
     else:
-        return '11+ years'
\ No newline at end of file
+        return '11+ years'
+
+
+# Categories of categorize_experience, in order
+EXPERIENCE_CATEGORIES = ['Less than 1 year', '1–2 years', '3–5 years', '6–10 years', '11+ years']
+# Bin edges: a value moves to the next bin when years >= edge (closed) or years > edge (open)
+EXPERIENCE_CLOSED_EDGES = np.array([1, 3, 6])
+EXPERIENCE_OPEN_EDGES = np.array([2, 5, 10])
+# Category code of each bin: (-inf, 1), [1, 2], (2, 3), [3, 5], (5, 6), [6, 10], (10, inf)
+# The gaps (2, 3) and (5, 6) fall into '11+ years' as in categorize_experience, so does NaN
+EXPERIENCE_BIN_CODES = np.array([0, 1, 4, 2, 4, 3, 4])
+
+# Vectorized version of categorize_experience, returns an ordered Categorical
+def categorize_experience_vectorized(years):
+    values = np.asarray(years, dtype=float)
+    # NaN sorts after every edge, so it ends up in the last bin
+    bins = (np.searchsorted(EXPERIENCE_CLOSED_EDGES, values, side='right') +
+            np.searchsorted(EXPERIENCE_OPEN_EDGES, values, side='left'))
+    categories = pd.Categorical.from_codes(EXPERIENCE_BIN_CODES[bins],
+                                           categories=EXPERIENCE_CATEGORIES,
+                                           ordered=True)
+    if isinstance(years, pd.Series):
+        return pd.Series(categories, index=years.index, name=years.name)
+    return categories
\ No newline at end of file
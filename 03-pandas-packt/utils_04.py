@@ -5,7 +5,16 @@ import seaborn as sns
 sns.set_theme()
 import datetime as dt
 
-class JamesBond:
+import sys
+from pathlib import Path
+
+# utils_common lives at the repository root, searched after the folder's own modules
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+from utils_common import load_cached, MemoryReportMixin, parse_distinct
+
+class JamesBond(MemoryReportMixin):
 
     # Column names
     FILM = 'Film'
@@ -16,21 +25,37 @@ class JamesBond:
     BUDGET = 'Budget'
     BOND_ACTOR_SALARY = 'Bond Actor Salary'
 
+    # Compact dtypes used with compact=True
+    DTYPES = {
+        YEAR: 'int16',
+        ACTOR: 'category',
+        DIRECTOR: 'category',
+        BOX_OFFICE: 'float32',
+        BUDGET: 'float32',
+        BOND_ACTOR_SALARY: 'float32',
+    }
+
     def __init__(self, 
-                 filepath='data/jamesbond.csv'):
+                 filepath='data/jamesbond.csv',
+                 compact=False,  # Use the compact dtypes from DTYPES
+                 cache_dir=None):  # Cache the parsed data as Parquet (see utils_common)
         
         # Default parameters
         self.filepath = filepath
+        self.compact = compact
+        self.cache_dir = cache_dir
 
         # Load the DataFrame
-        self.bond = self._load_data()
+        self.bond = load_cached(self._load_data, [self.filepath], self.cache_dir,
+                                compact=self.compact)
 
     def _load_data(self):
-        df = pd.read_csv(self.filepath)
+        df = pd.read_csv(self.filepath, dtype=self.DTYPES if self.compact else None)
         
         return df
-    
-class NFL:
+
+
+class NFL(MemoryReportMixin):
 
     # Column names: Name,Team,Position,Birthday,Salary
     NAME = 'Name'
@@ -39,21 +64,36 @@ class NFL:
     BIRTHDAY = 'Birthday'
     SALARY = 'Salary'
 
+    # Compact dtypes used with compact=True
+    DTYPES = {
+        TEAM: 'category',
+        POSITION: 'category',
+        SALARY: 'int32',
+    }
+
     def __init__(self, 
                  filepath='data/nfl.csv',
-                 date_format='%m/%d/%Y'):  # To match '7/21/1983'
+                 date_format='%m/%d/%Y',  # To match '7/21/1983'
+                 compact=False,  # Use the compact dtypes from DTYPES
+                 cache_dir=None):  # Cache the parsed data as Parquet (see utils_common)
         
         # Default parameters
         self.filepath = filepath
         self.date_format = date_format
+        self.compact = compact
+        self.cache_dir = cache_dir
 
         # Load the DataFrame
-        self.nfl = self._load_data()
+        self.nfl = load_cached(self._load_data, [self.filepath], self.cache_dir,
+                               date_format=self.date_format, compact=self.compact)
 
     def _load_data(self):
-        df = pd.read_csv(self.filepath)
+        df = pd.read_csv(self.filepath, dtype=self.DTYPES if self.compact else None)
 
-        # Convert the birthday column to datetime
-        df[self.BIRTHDAY] = pd.to_datetime(df[self.BIRTHDAY], format=self.date_format)
+        # Convert the birthday column to datetime, each distinct date is parsed once
+        df[self.BIRTHDAY] = parse_distinct(
+            df[self.BIRTHDAY],
+            lambda dates: pd.to_datetime(dates, format=self.date_format)
+        )
 
-        return df
\ No newline at end of file
+        return df
@@ -3,8 +3,18 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 sns.set_theme()
+import datetime as dt
 
-class Employees:
+import sys
+from pathlib import Path
+
+# utils_common lives at the repository root, searched after the folder's own modules
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+from utils_common import load_cached, MemoryReportMixin, lazy_table, MultiValueColumn, parse_distinct
+
+class Employees(MemoryReportMixin):
 
     # Column names 
     # First Name	Gender	Start Date	Last Login Time	Salary	Bonus %	Senior Management	Team
@@ -17,32 +27,48 @@ class Employees:
     SENIOR_MANAGEMENT = 'Senior Management'
     TEAM = 'Team'
 
+    # Compact dtypes used with compact=True
+    DTYPES = {
+        GENDER: 'category',
+        SALARY: 'int32',
+        BONUS: 'float32',
+        TEAM: 'category',
+    }
+
     def __init__(self, 
                  filepath='data/Employees.csv',
                  date_format='%m/%d/%Y',
-                 time_format='%I:%M %p'):  # To match '8/6/1993'
+                 time_format='%I:%M %p',  # To match '8/6/1993'
+                 compact=False,  # Use the compact dtypes from DTYPES
+                 login_minutes=False,  # Last Login Time as Int16 minutes since midnight
+                 cache_dir=None):  # Cache the parsed data as Parquet (see utils_common)
         
         # Default parameters
         self.filepath = filepath
         self.date_format = date_format
         self.time_format = time_format
+        self.compact = compact
+        self.login_minutes = login_minutes
+        self.cache_dir = cache_dir
 
         # Load the DataFrame
-        self.employees = self._load_data()
+        self.employees = load_cached(self._load_data, [self.filepath], self.cache_dir,
+                                     date_format=self.date_format, time_format=self.time_format,
+                                     compact=self.compact, login_minutes=self.login_minutes)
 
     def _load_data(self):
-        df = pd.read_csv(
-            self.filepath,
-            parse_dates=[self.START_DATE],
-            date_format={self.START_DATE: self.date_format},
+        df = pd.read_csv(self.filepath, dtype=self.DTYPES if self.compact else None)
+
+        # Parse 'Start Date', each distinct date is parsed once
+        df[self.START_DATE] = parse_distinct(
+            df[self.START_DATE],
+            lambda dates: pd.to_datetime(dates, format=self.date_format)
         )
 
-        # Parse 'Last Login Time' to time only
-        df[self.LAST_LOGIN_TIME] = pd.to_datetime(
-            df[self.LAST_LOGIN_TIME], 
-            format=self.time_format,
-            errors='coerce'
-        ).dt.time
+        # Parse 'Last Login Time' to time only (or minutes since midnight)
+        df[self.LAST_LOGIN_TIME] = parse_distinct(df[self.LAST_LOGIN_TIME], self._parse_times)
+        if self.login_minutes:
+            df[self.LAST_LOGIN_TIME] = df[self.LAST_LOGIN_TIME].astype('Int16')
 
         # Convert 'Senior Management' to boolean
         df['Senior Management'] = df['Senior Management'].astype(bool)
@@ -52,8 +78,29 @@ class Employees:
         
         return df
 
+    def _parse_times(self, times):
+        times = pd.to_datetime(times, format=self.time_format, errors='coerce')
+        if self.login_minutes:
+            return times.dt.hour * 60 + times.dt.minute
+        return times.dt.time
+
+    @staticmethod
+    def to_minutes(time):
+        """Minutes since midnight of a datetime.time."""
+        return time.hour * 60 + time.minute
+
+    def logged_in_between(self, start, end):
+        """
+        Mask of the employees whose last login time is between start and end
+        (datetime.time, inclusive). With login_minutes it compares integers.
+        """
+        login = self.employees[self.LAST_LOGIN_TIME]
+        if self.login_minutes:
+            return login.between(self.to_minutes(start), self.to_minutes(end)).fillna(False).astype(bool)
+        return login.map(lambda time: isinstance(time, dt.time) and start <= time <= end)
 
-class NETFLIX:
+
+class NETFLIX(MemoryReportMixin):
 
     # Column names: title,director,date_added,type
     TITLE = 'title'
@@ -61,25 +108,46 @@ class NETFLIX:
     DATE_ADDED = 'date_added'
     TYPE = 'type'
 
+    # Compact dtypes used with compact=True
+    DTYPES = {
+        TYPE: 'category',
+    }
+
     def __init__(self, 
                  filepath='data/netflix.csv',
-                 date_format='%d-%b-%y'):  # To match '15-Apr-17'
+                 date_format='%d-%b-%y',  # To match '15-Apr-17'
+                 compact=False,  # Use the compact dtypes from DTYPES
+                 cache_dir=None):  # Cache the parsed data as Parquet (see utils_common)
         
         # Default parameters
         self.filepath = filepath
         self.date_format = date_format
+        self.compact = compact
+        self.cache_dir = cache_dir
 
         # Load the DataFrame
-        self.netflix = self._load_data()
+        self.netflix = load_cached(self._load_data, [self.filepath], self.cache_dir,
+                                   date_format=self.date_format, compact=self.compact)
 
     def _load_data(self):
-        df = pd.read_csv(
-            self.filepath,
-            parse_dates=[self.DATE_ADDED],
-            date_format={self.DATE_ADDED: self.date_format},
+        df = pd.read_csv(self.filepath, dtype=self.DTYPES if self.compact else None)
+
+        # Parse 'date_added', each distinct date is parsed once
+        df[self.DATE_ADDED] = parse_distinct(
+            df[self.DATE_ADDED],
+            lambda dates: pd.to_datetime(dates, format=self.date_format)
         )
 
         # Convert 'type' to category
         df[self.TYPE] = df[self.TYPE].astype('category')
         
-        return df
\ No newline at end of file
+        return df
+
+    # A title can have several directors, e.g. 'Joel Coen, Ethan Coen'
+    @lazy_table('netflix')
+    def directors(self):
+        return MultiValueColumn(self.netflix[self.DIRECTOR], sep=', ')
+
+    def has_director(self, director):
+        """Mask of the titles directed (or co-directed) by director."""
+        return self.directors.contains(director)
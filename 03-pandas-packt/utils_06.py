@@ -1,10 +1,24 @@
+import numpy as np
 import pandas as pd
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+# Use pyarrow to run the pattern on many names when it is installed
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
+
+# ASCII characters that re and RE2 read differently: re's \s also matches \x0b and
+# \x1c-\x1f, and re's $ also matches before a final \n
+RE2_UNSAFE_CHARS = r'[\n\x0b\x1c-\x1f]'
 
 class FirstNameExtractor:
 
     def __init__(self, 
-                 pattern_string=r',\s*([A-Z\-]+)'):
+                 pattern_string=r',\s*(?P<first_name>[A-Z\-]+)'):
         # Compile the regex pattern to match the first name
         self.pattern = re.compile(pattern_string)
 
@@ -13,6 +27,90 @@ class FirstNameExtractor:
         if match:
             return match.group(1).title()  # Capitalize nicely
         return None
+
+    def extract_many(self, names, engine=None, executor='serial', max_workers=None,
+                     chunksize=1_000_000):
+        """
+        Same results as extract_first_name for every name of a Series, array or list
+        (None for non-matches and missing names). Each distinct first name is
+        title-cased once.
+        engine='pyarrow' runs the pattern in pyarrow (RE2 syntax and named groups only,
+        as in the default pattern), names that RE2 could read differently from re
+        (non-ASCII, unusual whitespace or a newline) are redone with re. engine='python'
+        runs the compiled pattern in a single loop, about as fast as
+        .apply(extract_first_name). By default pyarrow is used when it is installed and
+        can run the pattern (see _pyarrow_supports_pattern), python otherwise.
+        executor='process' splits the names into chunks of chunksize and extracts them
+        in parallel on max_workers processes.
+        """
+        if engine is None:
+            engine = 'pyarrow' if self._pyarrow_supports_pattern() else 'python'
+        if engine not in ('python', 'pyarrow'):
+            raise ValueError("Invalid engine. Use 'python' or 'pyarrow'.")
+        if engine == 'pyarrow' and not self._pyarrow_supports_pattern():
+            raise ValueError("engine='pyarrow' needs pyarrow and a pattern in RE2 syntax with "
+                             "named groups only, e.g. (?P<first_name>...). Use engine='python'.")
+
+        index = names.index if isinstance(names, pd.Series) else None
+        names = np.asarray(names, dtype=object)
+        extract = partial(self._extract_chunk, engine=engine)
+
+        if executor == 'process' and len(names) > chunksize:
+            chunks = [names[start:start + chunksize] for start in range(0, len(names), chunksize)]
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                first_names = np.concatenate(list(pool.map(extract, chunks)))
+        elif executor in ('serial', 'process'):
+            first_names = extract(names)
+        else:
+            raise ValueError("Invalid executor. Use 'serial' or 'process'.")
+
+        return pd.Series(first_names, index=index)
+
+    def _pyarrow_supports_pattern(self):
+        """
+        True when pyarrow is installed and runs the pattern as re does: extract_regex
+        needs named groups only, and RE2 has no lookarounds or backreferences (the
+        trial compile fails). '[:' starts a POSIX class in RE2 but not in re.
+        """
+        if pa is None or not self.pattern.groups:
+            return False
+        if self.pattern.groups != len(self.pattern.groupindex) or '[:' in self.pattern.pattern:
+            return False
+        try:
+            pc.extract_regex(pa.array([], type=pa.string()), self.pattern.pattern)
+        except pa.ArrowInvalid:
+            return False
+        return True
+
+    def _extract_chunk(self, names, engine='python'):
+        # Matched first names as codes into the distinct matches, -1 when there is no match
+        if engine == 'pyarrow':
+            array = pa.array(names, type=pa.string(), from_pandas=True)
+            matches = pc.struct_field(pc.extract_regex(array, self.pattern.pattern), [0])
+
+            # RE2 classes such as \s and \w differ from re's outside plain ASCII
+            redo = pc.fill_null(pc.or_(pc.invert(pc.string_is_ascii(array)),
+                                       pc.match_substring_regex(array, RE2_UNSAFE_CHARS)), False)
+            if pc.any(redo).as_py():
+                rows = np.flatnonzero(redo.to_numpy(zero_copy_only=False))
+                matches = pc.replace_with_mask(matches, redo,
+                                               pa.array(self._search(names[rows]), type=pa.string()))
+
+            matches = matches.dictionary_encode()
+            codes = matches.indices.fill_null(-1).to_numpy()
+            uniques = matches.dictionary.to_pylist()
+        else:
+            codes, uniques = pd.factorize(np.array(self._search(names), dtype=object))
+
+        # Code -1 (no match) picks the None appended at the end
+        titled = np.array([match.title() for match in uniques] + [None], dtype=object)
+        return titled[codes]
+
+    def _search(self, names):
+        # First group of the pattern for every name, None when there is no match
+        search = self.pattern.search
+        return [match.group(1) if isinstance(name, str) and (match := search(name)) else None
+                for name in names]
     
 def test_first_name_extractor():
     extractor = FirstNameExtractor()
@@ -44,5 +142,43 @@ def test_first_name_extractor():
     assert results == expected #, f"Expected {expected}, got {results}"
     # print("All tests passed.")
 
+def test_extract_many():
+    extractor = FirstNameExtractor()
+    test_names = pd.Series([
+        "AARON,  ELVIA J",
+        "ABAD JR,  VICENTE M",
+        "NO COMMA HERE",
+        "ABBATACOLA,  ROBERT J",
+        "AARON,  ELVIA J",
+    ], index=list('abcde'))
+    expected = [extractor.extract_first_name(name) for name in test_names]
+    results = extractor.extract_many(test_names)
+    assert results.tolist() == expected
+    assert results.index.equals(test_names.index)
+    results = extractor.extract_many(test_names, executor='process', max_workers=2, chunksize=2)
+    assert results.tolist() == expected
+    results = extractor.extract_many(test_names, engine='python')
+    assert results.tolist() == expected
+    # re's \s also matches these, RE2's does not
+    test_names = pd.Series(["AARON,\x0bELVIA J", "ABARCA,\u00a0ANABEL", None])
+    expected = [extractor.extract_first_name(name) if name else None for name in test_names]
+    assert expected[:2] == ["Elvia", "Anabel"]
+    results = extractor.extract_many(test_names, engine='pyarrow')
+    assert results.tolist() == expected
+    # Patterns that RE2 rejects (lookahead, unnamed group) or reads differently ($)
+    test_names = pd.Series(["AARON,  ELVIA J", "AARON,  ELVIA\n", "ABARCA,  ANABEL", "NO COMMA"])
+    for pattern in [r',\s*(?P<first>[A-Z]+)(?=\s)', r'(,)\s*(?P<first>[A-Z]+)',
+                    r',\s*(?P<first>[A-Z]+)$']:
+        extractor = FirstNameExtractor(pattern)
+        expected = [extractor.extract_first_name(name) for name in test_names]
+        assert extractor.extract_many(test_names).tolist() == expected
+    assert expected == [None, "Elvia", "Anabel", None]
+    try:
+        FirstNameExtractor(r'(,)\s*(?P<first>[A-Z]+)').extract_many(test_names, engine='pyarrow')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("engine='pyarrow' should reject an unnamed group")
+
 # if __name__ == "__main__":
 #     test_first_name_extractor()
\ No newline at end of file
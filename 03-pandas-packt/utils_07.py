@@ -4,40 +4,63 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 sns.set_theme()
 
+import sys
+from pathlib import Path
 
-class BIGMAC:
+# utils_common lives at the repository root, searched after the folder's own modules
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+from utils_common import load_cached, MemoryReportMixin
+
+
+class BIGMAC(MemoryReportMixin):
 
     # Column names: Date,Country,Price in US Dollars
     DATE = 'Date'
     COUNTRY = 'Country'
     PRICE = 'Price in US Dollars'
 
+    # Compact dtypes used with compact=True
+    DTYPES = {
+        COUNTRY: 'category',
+        PRICE: 'float32',
+    }
+
     def __init__(self, 
                  filepath='data/bigmac.csv',
                  index_col=None,
                  round=False,
-                 precision=2):
+                 precision=2,
+                 compact=False,  # Use the compact dtypes from DTYPES
+                 cache_dir=None):  # Cache the parsed data as Parquet (see utils_common)
         
         # Default parameters
         self.filepath = filepath
         self.index_col = index_col
         self.round = round
         self.precision = precision
+        self.compact = compact
+        self.cache_dir = cache_dir
 
         # Load the DataFrame
-        self.bigmac = self._load_data()
+        self.bigmac = load_cached(self._load_data, [self.filepath], self.cache_dir,
+                                  index_col=self.index_col, round=self.round, precision=self.precision,
+                                  compact=self.compact)
 
     def _load_data(self):
         # Parse dates while reading the CSV file: 2000-04-01
         df = pd.read_csv(self.filepath, 
                          parse_dates=[self.DATE],
                          date_format={self.DATE: '%Y-%m-%d'},
-                         index_col=self.index_col)
+                         index_col=self.index_col,
+                         dtype=self.DTYPES if self.compact else None)
         if self.round:
             df = df.round(self.precision)
         return df
-    
-class INVESTMENTS:
+
+
+class INVESTMENTS(MemoryReportMixin):
 
     # Column names: Name,Market,Status,State,Funding Rounds
     NAME = 'Name'
@@ -46,20 +69,34 @@ class INVESTMENTS:
     STATE = 'State'
     FUNDING_ROUNDS = 'Funding Rounds'
 
+    # Compact dtypes used with compact=True
+    DTYPES = {
+        MARKET: 'category',
+        STATUS: 'category',
+        STATE: 'category',
+        FUNDING_ROUNDS: 'int8',
+    }
+
     def __init__(self, 
                  filepath='data/investments.csv',
-                 index_col=["Status", "Funding Rounds", "State"]):
+                 index_col=["Status", "Funding Rounds", "State"],
+                 compact=False,  # Use the compact dtypes from DTYPES
+                 cache_dir=None):  # Cache the parsed data as Parquet (see utils_common)
         
         # Default parameters
         self.filepath = filepath
         self.index_col = index_col
+        self.compact = compact
+        self.cache_dir = cache_dir
 
         # Load the DataFrame
-        self.investments = self._load_data()
+        self.investments = load_cached(self._load_data, [self.filepath], self.cache_dir,
+                                       index_col=self.index_col, compact=self.compact)
 
     def _load_data(self):
         df = pd.read_csv(self.filepath, 
-                         index_col=self.index_col)
+                         index_col=self.index_col,
+                         dtype=self.DTYPES if self.compact else None)
         df = df.sort_index()
         
-        return df
\ No newline at end of file
+        return df
@@ -4,8 +4,17 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 sns.set_theme()
 
+import sys
+from pathlib import Path
 
-class FOOD:
+# utils_common lives at the repository root, searched after the folder's own modules
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+from utils_common import load_cached, MemoryReportMixin
+
+
+class FOOD(MemoryReportMixin):
 
     # Column names: First Name,Gender,City,Frequency,Item,Spend
     FIRST_NAME = 'First Name'
@@ -15,22 +24,36 @@ class FOOD:
     ITEM = 'Item'
     SPEND = 'Spend'
 
+    # Compact dtypes used with compact=True
+    DTYPES = {
+        GENDER: 'category',
+        CITY: 'category',
+        FREQUENCY: 'category',
+        ITEM: 'category',
+        SPEND: 'float32',
+    }
+
     def __init__(self, 
-                 filepath='data/foods.csv'):
+                 filepath='data/foods.csv',
+                 compact=False,  # Use the compact dtypes from DTYPES
+                 cache_dir=None):  # Cache the parsed data as Parquet (see utils_common)
         
         # Default parameters
         self.filepath = filepath
+        self.compact = compact
+        self.cache_dir = cache_dir
 
         # Load the DataFrame
-        self.foods = self._load_data()
+        self.foods = load_cached(self._load_data, [self.filepath], self.cache_dir,
+                                 compact=self.compact)
 
     def _load_data(self):
-        df = pd.read_csv(self.filepath)
+        df = pd.read_csv(self.filepath, dtype=self.DTYPES if self.compact else None)
         
         return df
-    
 
-class Cars:
+
+class Cars(MemoryReportMixin):
     
     # Column names: Manufacturer,Year,Fuel,Transmission,Price
     MANUFACTURER = 'Manufacturer'
@@ -39,17 +62,32 @@ class Cars:
     TRANSMISSION = 'Transmission'
     PRICE = 'Price'
 
+    # Compact dtypes used with compact=True
+    DTYPES = {
+        MANUFACTURER: 'category',
+        YEAR: 'int16',
+        FUEL: 'category',
+        TRANSMISSION: 'category',
+        PRICE: 'float32',
+    }
+
     def __init__(self, 
-                 filepath='data/used_cars.csv'):
+                 filepath='data/used_cars.csv',
+                 compact=False,  # Use the compact dtypes from DTYPES
+                 cache_dir=None):  # Cache the parsed data as Parquet (see utils_common)
         
         # Default parameters
         self.filepath = filepath
+        self.compact = compact
+        self.cache_dir = cache_dir
 
         # Load the DataFrame
-        self.cars = self._load_data()
+        self.cars = load_cached(self._load_data, [self.filepath], self.cache_dir,
+                                compact=self.compact)
 
     def _load_data(self):
-        df = pd.read_csv(self.filepath)
-        df[self.PRICE] = df[self.PRICE].astype(float)
+        df = pd.read_csv(self.filepath, dtype=self.DTYPES if self.compact else None)
+        if not self.compact:
+            df[self.PRICE] = df[self.PRICE].astype(float)
         
-        return df
\ No newline at end of file
+        return df
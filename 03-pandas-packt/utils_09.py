@@ -4,7 +4,16 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 sns.set_theme()
 
-class Fortune1000:
+import sys
+from pathlib import Path
+
+# utils_common lives at the repository root, searched after the folder's own modules
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+from utils_common import load_cached, MemoryReportMixin
+
+class Fortune1000(MemoryReportMixin):
 
     # Column names
     COMPANY = 'Company'
@@ -14,21 +23,36 @@ class Fortune1000:
     PROFITS = 'Profits'
     EMPLOYEES = 'Employees'
 
+    # Compact dtypes used with compact=True
+    DTYPES = {
+        SECTOR: 'category',
+        INDUSTRY: 'category',
+        REVENUE: 'int32',
+        PROFITS: 'float32',
+        EMPLOYEES: 'int32',
+    }
+
     def __init__(self, 
-                 filepath='data/fortune1000.csv'):
+                 filepath='data/fortune1000.csv',
+                 compact=False,  # Use the compact dtypes from DTYPES
+                 cache_dir=None):  # Cache the parsed data as Parquet (see utils_common)
         
         # Default parameters
         self.filepath = filepath
+        self.compact = compact
+        self.cache_dir = cache_dir
 
         # Load the DataFrame
-        self.fortune = self._load_data()
+        self.fortune = load_cached(self._load_data, [self.filepath], self.cache_dir,
+                                   compact=self.compact)
 
     def _load_data(self):
-        df = pd.read_csv(self.filepath, index_col="Rank")
+        df = pd.read_csv(self.filepath, index_col="Rank", dtype=self.DTYPES if self.compact else None)
         
         return df
 
-class Cereals:
+
+class Cereals(MemoryReportMixin):
 
     # Column names
     NAME = 'Name'
@@ -38,16 +62,30 @@ class Cereals:
     FIBER = 'Fiber'
     SUGARS = 'Sugars'
 
+    # Compact dtypes used with compact=True
+    DTYPES = {
+        MANUFACTURER: 'category',
+        TYPE: 'category',
+        CALORIES: 'int16',
+        FIBER: 'float32',
+        SUGARS: 'float32',
+    }
+
     def __init__(self, 
-                 filepath='data/cereals.csv'):
+                 filepath='data/cereals.csv',
+                 compact=False,  # Use the compact dtypes from DTYPES
+                 cache_dir=None):  # Cache the parsed data as Parquet (see utils_common)
         
         # Default parameters
         self.filepath = filepath
+        self.compact = compact
+        self.cache_dir = cache_dir
 
         # Load the DataFrame
-        self.cereals = self._load_data()
+        self.cereals = load_cached(self._load_data, [self.filepath], self.cache_dir,
+                                   compact=self.compact)
 
     def _load_data(self):
-        df = pd.read_csv(self.filepath)
+        df = pd.read_csv(self.filepath, dtype=self.DTYPES if self.compact else None)
         
-        return df
\ No newline at end of file
+        return df
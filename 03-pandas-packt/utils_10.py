@@ -3,8 +3,17 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 sns.set_theme()
 
+import sys
+from pathlib import Path
 
-class Restaurant:
+# utils_common lives at the repository root, searched after the folder's own modules
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+from utils_common import read_files_parallel, MemoryReportMixin
+
+
+class Restaurant(MemoryReportMixin):
 
     # Column names
     # Customers: ID,First Name,Last Name,Gender,Company,Occupation
@@ -24,12 +33,27 @@ class Restaurant:
     # Customer ID,Food ID
     CUST_FOOD_ID = 'Customer ID,Food ID'
 
+    # Compact dtypes used with compact=True, for all four files
+    DTYPES = {
+        ID: 'int32',
+        CUSTOMER_ID: 'int32',
+        GENDER: 'category',
+        OCCUPATION: 'category',
+        FOOD_ID: 'int16',
+        FOOD_ITEM: 'category',
+        PRICE: 'float32',
+    }
+
     def __init__(self, 
                  customers_filepath='data/customers.csv',
                  food_filepath='data/foods.csv',
                  week1_filepath='data/week_1_sales.csv',
                  week2_filepath='data/week_2_sales.csv',
-                 preserve_index=False):  # Preserve index when concatenating weeks
+                 preserve_index=False,  # Preserve index when concatenating weeks
+                 compact=False,  # Use the compact dtypes from DTYPES
+                 executor='thread',  # 'thread', 'process' or 'serial'
+                 max_workers=None,
+                 verbose=False):  # Print the parse time per file
 
         # Default parameters
         self.customers_filepath = customers_filepath
@@ -37,29 +61,25 @@ class Restaurant:
         self.week1_filepath = week1_filepath
         self.week2_filepath = week2_filepath
         self.preserve_index = preserve_index
+        self.compact = compact
+        self.executor = executor
+        self.max_workers = max_workers
+        self.verbose = verbose
 
         # Load the DataFrames
-        self.customers = self._load_customers()
-        self.food = self._load_food()
-        self.week1 = self._load_week1()
-        self.week2 = self._load_week2()
+        self.customers, self.food, self.week1, self.week2 = self._load_data()
         self.weeks = self._concat_weeks()
 
-    def _load_customers(self):
-        df = pd.read_csv(self.customers_filepath)
-        return df
-    
-    def _load_food(self):
-        df = pd.read_csv(self.food_filepath)
-        return df
-    
-    def _load_week1(self):
-        df = pd.read_csv(self.week1_filepath)
-        return df
-
-    def _load_week2(self):
-        df = pd.read_csv(self.week2_filepath)
-        return df
+    def _load_data(self):
+        # Read the four files in parallel
+        paths = [self.customers_filepath, self.food_filepath,
+                 self.week1_filepath, self.week2_filepath]
+        dfs, self.load_times = read_files_parallel(paths,
+                                                   executor=self.executor,
+                                                   max_workers=self.max_workers,
+                                                   verbose=self.verbose,
+                                                   dtype=self.DTYPES if self.compact else None)
+        return dfs
     
     def _concat_weeks(self):
         if self.preserve_index:
@@ -69,4 +89,4 @@ class Restaurant:
         else:   
             df = pd.concat([self.week1, self.week2], 
                         ignore_index=True)
-        return df
\ No newline at end of file
+        return df
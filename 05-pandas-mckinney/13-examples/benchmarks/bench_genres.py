@@ -0,0 +1,78 @@
+"""
+Benchmark the per-genre statistics of MovieLens computed through the compact genre
+encoding (MovieLens.genres, get_genre_stats) against data_by_genre, the ratings
+merged with the exploded genres. Reports time and memory of both.
+
+Run from the 13-examples folder:
+    python benchmarks/bench_genres.py --rows 1000000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add the parent directory (13-examples) to sys.path to import utils_02
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils_02 import MovieLens
+from bench_utils_02 import make_ratings_file
+
+GENRES = ['Action', 'Adventure', 'Animation', "Children's", 'Comedy', 'Crime', 'Documentary',
+          'Drama', 'Fantasy', 'Film-Noir', 'Horror', 'Musical', 'Mystery', 'Romance', 'Sci-Fi',
+          'Thriller', 'War', 'Western']
+
+
+def make_movielens(directory, rows, users=6040, movies=3952, seed=0):
+    """Synthetic users.dat, movies.dat and ratings.dat with the MovieLens 1M sizes."""
+    rng = np.random.default_rng(seed)
+    with open(os.path.join(directory, 'users.dat'), 'w') as f:
+        for user_id in range(1, users + 1):
+            f.write(f'{user_id}::{rng.choice(["F", "M"])}::{rng.choice([1, 18, 25, 35, 45, 50, 56])}'
+                    f'::{rng.integers(0, 21)}::{rng.integers(10000, 99999)}\n')
+    with open(os.path.join(directory, 'movies.dat'), 'w') as f:
+        for movie_id in range(1, movies + 1):
+            genres = rng.choice(GENRES, rng.integers(1, 4), replace=False)
+            f.write(f'{movie_id}::Movie {movie_id} ({rng.integers(1919, 2001)})::{"|".join(genres)}\n')
+    make_ratings_file(os.path.join(directory, 'ratings.dat'), rows, seed=seed)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000, help='ratings in the synthetic data')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        make_movielens(tmp, args.rows)
+        ml = MovieLens(users_filepath=os.path.join(tmp, 'users.dat'),
+                       ratings_filepath=os.path.join(tmp, 'ratings.dat'),
+                       movies_filepath=os.path.join(tmp, 'movies.dat'))
+
+    data_by_genre, merge_time = timed(lambda: ml.data_by_genre)
+    old, old_time = timed(lambda: data_by_genre.groupby([ml.GENRES, ml.GENDER])[ml.RATING].mean())
+    old_memory = data_by_genre.memory_usage(deep=True).sum()
+
+    genres, encode_time = timed(lambda: ml.genres)
+    new, new_time = timed(lambda: ml.get_genre_stats(ml.GENDER)[ml.MEAN])
+    assert np.array_equal(old.to_numpy(), new.to_numpy())
+    assert list(old.index) == list(new.index)
+
+    print(f'{len(ml.ratings):,} ratings, {len(data_by_genre):,} rows in data_by_genre')
+    print(f'data_by_genre: {merge_time:6.2f} s to build, {old_time:6.3f} s per query, '
+          f'{old_memory / 1e6:8.1f} MB')
+    print(f'genres:        {encode_time:6.2f} s to build, {new_time:6.3f} s per query, '
+          f'{genres.nbytes / 1e6:8.3f} MB')
+
+
+if __name__ == '__main__':
+    main()
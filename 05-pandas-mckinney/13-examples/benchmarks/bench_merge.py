@@ -0,0 +1,65 @@
+"""
+Benchmark MovieLens._merge_data (lookup arrays indexed by id and take) against the
+previous pd.merge(indicator=True) + _check_merge path, plain and by genre.
+
+Run from the 13-examples folder:
+    python benchmarks/bench_merge.py --rows 1000000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Add the parent directory (13-examples) to sys.path to import utils_02
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils_02 import MovieLens
+from bench_genres import make_movielens
+
+
+def merge_data_old(ml, by_genre=False):
+    """The previous MovieLens._merge_data."""
+    data = pd.merge(ml.ratings, ml.users, on=ml.USER_ID, how='left', indicator=True)
+    data = ml._check_merge(data, 'users')
+    movies = ml._explode_genre() if by_genre else ml.movies
+    data = pd.merge(data, movies, on=ml.MOVIE_ID, how='left', indicator=True)
+    return ml._check_merge(data, 'movies')
+
+
+def best_of(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000, help='ratings in the synthetic data')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        make_movielens(tmp, args.rows)
+        ml = MovieLens(users_filepath=os.path.join(tmp, 'users.dat'),
+                       ratings_filepath=os.path.join(tmp, 'ratings.dat'),
+                       movies_filepath=os.path.join(tmp, 'movies.dat'))
+
+    print(f'{len(ml.ratings):,} ratings')
+    for by_genre in (False, True):
+        old, old_time = best_of(lambda: merge_data_old(ml, by_genre))
+        new, new_time = best_of(lambda: ml._merge_data(by_genre))
+        assert old.equals(new)
+        label = 'by genre' if by_genre else 'plain'
+        print(f'  {label:<9} pd.merge: {old_time:.3f} s  lookup arrays: {new_time:.3f} s  '
+              f'({old_time / new_time:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark the counting approaches of USA_GOV.count_time_zones (simple, defaultdict,
+Counter, numpy, pandas) on synthetic time zones, given as a list, an object Series
+and a categorical. Reports the time and the peak memory of each, and the input
+size from which value_counts on a Series is faster than Counter on a list
+(PANDAS_MIN_SIZE in utils_01).
+
+Run from the 13-examples folder:
+    python benchmarks/bench_utils_01.py --sizes 10000,100000,1000000,10000000,50000000
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add the parent directory (13-examples) to sys.path to import utils_01
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils_01 import count_values, select_counting_approach, PANDAS_MIN_SIZE
+
+TIME_ZONES = (['America/New_York', 'America/Chicago', '', 'America/Los_Angeles',
+               'America/Denver', 'Europe/London', 'Asia/Tokyo'] +
+              [f'Region/City_{i}' for i in range(500)])
+
+
+def make_time_zones(size, rng):
+    """A skewed list of time zones, as in the bitly data, with a few None."""
+    time_zones = [TIME_ZONES[i] for i in (rng.zipf(1.5, size) - 1) % len(TIME_ZONES)]
+    for i in rng.integers(0, size, size // 1000):
+        time_zones[i] = None
+    return time_zones
+
+
+def measure(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    # Peak memory in a separate run, tracemalloc slows python code down
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, min(times), peak
+
+
+def run(size, rng, repeat, skip_slow):
+    time_zones = make_time_zones(size, rng)
+    series = pd.Series(time_zones, dtype=object)
+    categorical = series.astype('category')
+
+    strategies = {
+        'Counter (list)': lambda: count_values(time_zones, 'Counter'),
+        'pandas (Series)': lambda: count_values(series, 'pandas'),
+        'numpy (Series)': lambda: count_values(series, 'numpy'),
+        'numpy (categorical)': lambda: count_values(categorical, 'numpy'),
+        'auto (Series)': lambda: count_values(series, 'auto'),
+    }
+    if not skip_slow:
+        strategies['simple (list)'] = lambda: count_values(time_zones, 'simple')
+        strategies['defaultdict (list)'] = lambda: count_values(time_zones, 'defaultdict')
+
+    print(f'{size:,} values, auto selects {select_counting_approach(series)!r} for a Series')
+    expected = dict(count_values(time_zones, 'Counter'))
+    times = {}
+    for label, func in strategies.items():
+        result, seconds, peak = measure(func, repeat)
+        assert dict(result) == expected, label
+        times[label] = seconds
+        print(f'  {label:<22} {seconds:9.4f} s  {peak / 1e6:9.1f} MB peak')
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', default='10000,100000,1000000,10000000',
+                        help='comma separated numbers of values')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--skip-slow', action='store_true',
+                        help='skip the simple and defaultdict approaches')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    pandas_faster = []
+    for size in map(int, args.sizes.split(',')):
+        times = run(size, rng, args.repeat, args.skip_slow)
+        if times['pandas (Series)'] < times['Counter (list)']:
+            pandas_faster.append(size)
+
+    print(f'pandas on a Series beats Counter from {min(pandas_faster):,} values'
+          if pandas_faster else 'pandas on a Series never beats Counter')
+    print(f'PANDAS_MIN_SIZE in utils_01: {PANDAS_MIN_SIZE:,}')
+
+
+if __name__ == '__main__':
+    main()
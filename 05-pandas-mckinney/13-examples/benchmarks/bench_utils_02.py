@@ -0,0 +1,84 @@
+"""
+Benchmark the python engine against the C engine fast path (SeparatorTranslator)
+for reading '::'-delimited MovieLens ratings.
+
+Run from the 13-examples folder:
+    python benchmarks/bench_utils_02.py --rows 25000000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add the parent directory (13-examples) to sys.path to import utils_02
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils_02 import MovieLens, read_dat
+
+RATING_NAMES = [MovieLens.USER_ID, MovieLens.MOVIE_ID, MovieLens.RATING, MovieLens.TIMESTAMP]
+RATING_DTYPES = {col: MovieLens.DTYPES[col] for col in RATING_NAMES if col in MovieLens.DTYPES}
+
+
+def make_ratings_file(path, rows, chunk=1_000_000, seed=0):
+    """Write a synthetic ratings.dat with `rows` lines in the MovieLens format."""
+    rng = np.random.default_rng(seed)
+    with open(path, 'w') as f:
+        for start in range(0, rows, chunk):
+            n = min(chunk, rows - start)
+            users = rng.integers(1, 6041, n)
+            movies = rng.integers(1, 3953, n)
+            ratings = rng.integers(1, 6, n)
+            timestamps = 956703932 + np.arange(start, start + n)
+            lines = [f'{u}::{m}::{r}::{t}\n' for u, m, r, t in zip(users, movies, ratings, timestamps)]
+            f.writelines(lines)
+
+
+def time_read(path, **kwargs):
+    start = time.perf_counter()
+    df = read_dat(path, RATING_NAMES, **kwargs)
+    return df, time.perf_counter() - start
+
+
+def run(path, skip_python=False):
+    print(f'{path} ({os.path.getsize(path) / 1e6:.0f} MB)')
+    results = {}
+    if not skip_python:
+        results['python'] = time_read(path, engine='python')
+    results['c'] = time_read(path, engine='c')
+    results['c, compact'] = time_read(path, engine='c', dtype=RATING_DTYPES)
+
+    for label, (df, seconds) in results.items():
+        memory = df.memory_usage(deep=True).sum() / 1e6
+        print(f'  {label:<12} {seconds:8.2f} s  {len(df) / seconds:>12,.0f} rows/s  {memory:8.1f} MB')
+
+    if 'python' in results:
+        # The fast path must produce the same values
+        expected = results['python'][0]
+        assert results['c'][0].equals(expected)
+        assert (results['c, compact'][0].astype(expected.dtypes) == expected).all().all()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--ratings', default='data/movielens/ratings.dat')
+    parser.add_argument('--rows', type=int, default=25_000_000, help='rows in the synthetic file')
+    parser.add_argument('--skip-python', action='store_true',
+                        help='skip the (slow) python engine on the synthetic file')
+    args = parser.parse_args()
+
+    if os.path.exists(args.ratings):
+        run(args.ratings)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'ratings_synthetic.dat')
+        make_ratings_file(path, args.rows)
+        run(path, skip_python=args.skip_python)
+
+
+if __name__ == '__main__':
+    main()
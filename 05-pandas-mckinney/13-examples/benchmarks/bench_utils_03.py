@@ -0,0 +1,51 @@
+"""
+Benchmark the vectorized top-N per group (utils_common.top_n_by_group) against
+groupby().apply(nlargest) on the BabyNames names frame.
+
+Run from the 13-examples folder:
+    python benchmarks/bench_utils_03.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add the parent directory (13-examples) to sys.path to import utils_03
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils_03 import BabyNames
+from utils_common import top_n_by_group
+
+
+def top_n_apply(df, by, column, n):
+    """The previous implementation: one nlargest call per group."""
+    return df.groupby(by).apply(lambda group: group.nlargest(n, column))
+
+
+def best_of(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+
+def main():
+    bn = BabyNames()
+    names = bn.names_with_prop
+    by = [bn.YEAR, bn.SEX]
+    print(f'names: {len(names):,} rows, {names.groupby(by).ngroups} groups')
+
+    old, old_time = best_of(lambda: top_n_apply(names, by, bn.BIRTHS, 1000).reset_index(drop=True))
+    new, new_time = best_of(lambda: top_n_by_group(names, by, bn.BIRTHS, 1000).reset_index(drop=True))
+    # Same rows; ties may come out in another order than nlargest's
+    columns = list(old.columns)
+    assert old.sort_values(columns, ignore_index=True).equals(new.sort_values(columns, ignore_index=True))
+
+    print(f'groupby().apply(nlargest): {old_time:.3f} s')
+    print(f'top_n_by_group:            {new_time:.3f} s  ({old_time / new_time:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+import pytest
+from pathlib import Path
+import sys
+import json
+from collections import Counter
+
+# Add the parent directory (13-examples) to sys.path to import utils_01
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import utils_01
+from utils_01 import USA_GOV, PANDAS_MIN_SIZE
+
+TIME_ZONES = ['America/New_York', '', 'Europe/London', None]
+
+def write_log(filepath, size):
+    # One record in ten has no tz key, the others have a time zone, an empty or a null one
+    records = [{'a': 'Mozilla/5.0 (Windows NT 6.1)'} if i % 10 == 0 else
+               {'a': 'GoogleMaps/RochesterNY', 'tz': TIME_ZONES[i % len(TIME_ZONES)]}
+               for i in range(size)]
+    filepath.write_text("\n".join(json.dumps(rec) for rec in records) + "\n")
+    return Counter(rec['tz'] for rec in records if 'tz' in rec)
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_count_time_zones_approaches(tmp_path, streaming):
+    expected = write_log(tmp_path / 'example.txt', 1000)
+    usa_gov = USA_GOV(filepath=tmp_path / 'example.txt', streaming=streaming)
+    for approach in ['simple', 'defaultdict', 'Counter', 'numpy', 'pandas', 'auto']:
+        assert usa_gov.count_time_zones(approach) == expected
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_count_time_zones_auto_large(tmp_path, monkeypatch, streaming):
+    expected = write_log(tmp_path / 'example.txt', 2 * PANDAS_MIN_SIZE)
+    usa_gov = USA_GOV(filepath=tmp_path / 'example.txt', streaming=streaming)
+
+    # Above PANDAS_MIN_SIZE 'auto' counts the Series with pandas (numpy when categorical)
+    def counter(sequence):
+        raise AssertionError("'auto' should not count with Counter")
+    monkeypatch.setitem(utils_01.COUNTING_APPROACHES, 'Counter', counter)
+    assert usa_gov.count_time_zones('auto') == expected
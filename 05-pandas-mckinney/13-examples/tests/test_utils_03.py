@@ -1,6 +1,7 @@
 import pytest
 from pathlib import Path
 import sys
+import pandas as pd
 
 # Add the parent directory (13-examples) to sys.path to import utils_03
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -23,4 +24,65 @@ def test_names_with_prop_shape():
 def test_prop_sum():
     bn = BabyNames()
     prop_sums = bn.names_with_prop.groupby([bn.YEAR, bn.SEX])[bn.PROP].sum()
-    assert all(prop_sums == 1.0)
\ No newline at end of file
+    assert all(prop_sums == 1.0)
+
+def assert_same_as_full_rebuild(bn):
+    full = BabyNames()
+    for attr in ['names', 'total_births', 'names_with_prop', 'top1000', 'boys', 'girls']:
+        pd.testing.assert_frame_equal(getattr(bn, attr), getattr(full, attr), obj=attr)
+    pd.testing.assert_frame_equal(bn.get_diversity(), full.get_diversity())
+
+def test_add_year():
+    bn = BabyNames(years=range(1880, 2010))
+    bn.get_diversity()  # Make sure the stored diversity is updated too
+    bn.add_year(2010)
+    assert_same_as_full_rebuild(bn)
+
+def test_add_year_in_the_middle():
+    bn = BabyNames(years=[year for year in range(1880, 2011) if year != 1950])
+    bn.add_year(1950)
+    assert_same_as_full_rebuild(bn)
+
+def test_add_year_already_loaded():
+    bn = BabyNames(years=range(2000, 2011))
+    with pytest.raises(ValueError):
+        bn.add_year(2010)
+
+def test_refresh():
+    bn = BabyNames(years=range(1880, 2008))
+    assert bn.refresh() == [2008, 2009, 2010]
+    assert bn.refresh() == []
+    assert_same_as_full_rebuild(bn)
+
+def test_diversity_quantiles():
+    bn = BabyNames()
+    diversity = bn.get_diversity([0.25, 0.5, 0.9])
+    pd.testing.assert_frame_equal(diversity[0.5], bn.get_diversity())
+    assert (diversity[0.25] <= diversity[0.5]).all().all()
+    assert (diversity[0.5] <= diversity[0.9]).all().all()
+
+def diversity_with_apply(top1000, q):
+    # The original implementation: sort and cumsum each (year, sex) group separately
+    def get_quantile_count(prop):
+        cumsum = prop.sort_values(ascending=False).cumsum()
+        return (cumsum <= q).sum() + 1
+    return (top1000.groupby([BabyNames.YEAR, BabyNames.SEX])[BabyNames.PROP]
+            .apply(get_quantile_count)
+            .unstack())
+
+def test_diversity_same_as_apply():
+    bn = BabyNames()
+    for q in [0.25, 0.5, 0.9]:
+        expected = diversity_with_apply(bn.top1000, q)
+        pd.testing.assert_frame_equal(bn.get_diversity(q), expected, check_dtype=False)
+
+def test_diversity_at_exact_quantile(tmp_path):
+    # The first four names add up to exactly half of the births
+    births = [898, 518, 465, 370, 205, 199, 198, 188, 186, 180, 178,
+              175, 164, 160, 160, 160, 140, 136, 117, 77, 26, 12]
+    lines = [f"Name{i},M,{count}" for i, count in enumerate(births)]
+    (tmp_path / "yob1880.txt").write_text("\n".join(lines) + "\n")
+    bn = BabyNames(directory=f"{tmp_path}/", years=[1880])
+    expected = diversity_with_apply(bn.top1000, 0.5)
+    pd.testing.assert_frame_equal(bn.get_diversity(), expected, check_dtype=False)
+    assert bn.get_diversity().loc[1880, 'M'] == 5
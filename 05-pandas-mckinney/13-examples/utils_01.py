@@ -3,9 +3,129 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 sns.set_theme()
 import json
+import os
+import time
+import heapq
+import numpy as np
+from itertools import islice
 
 from collections import defaultdict, Counter
 
+# Use orjson to parse the lines when it is installed
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# OS family -> substring of the user agent, the first match wins
+OS_FAMILIES = {'Windows': 'Windows'}
+# OS of the user agents that match no family (and of the missing ones)
+OTHER_OS = 'Not Windows'
+
+# Smallest array or Series counted with pandas by count_values(approach='auto'),
+# python lists are always faster with Counter (see benchmarks/bench_utils_01.py)
+PANDAS_MIN_SIZE = 10_000
+
+
+# Simple version
+def get_counts_simple(sequence):
+    counts = {}
+    for x in sequence:
+        if x in counts:
+            counts[x] += 1
+        else:
+            counts[x] = 1
+    return counts
+
+
+# Using defaultdict
+def get_counts_defaultdict(sequence):
+    counts = defaultdict(int)
+    for x in sequence:
+        counts[x] += 1
+    return counts
+
+
+# Using Counter from collections
+def get_counts_counter(sequence):
+    return Counter(sequence)
+
+
+# Using integer codes and np.bincount, categoricals are counted from their codes directly
+def get_counts_numpy(sequence):
+    if isinstance(getattr(sequence, 'dtype', None), pd.CategoricalDtype):
+        categorical = pd.Categorical(sequence)
+        codes, uniques = categorical.codes, categorical.categories
+    else:
+        codes, uniques = pd.factorize(np.asarray(sequence, dtype=object))
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    result = {value: count for value, count in zip(uniques.tolist(), counts.tolist()) if count}
+    # factorize gives code -1 to None/NaN
+    missing = len(codes) - counts.sum()
+    if missing:
+        result[None] = int(missing)
+    return result
+
+
+# Using value_counts (hash table in pandas), as count_time_zones_pandas
+def get_counts_pandas(sequence):
+    series = sequence if isinstance(sequence, pd.Series) else pd.Series(sequence, dtype=object)
+    counts = series.value_counts(dropna=False)
+    return {None if pd.isna(value) else value: count
+            for value, count in zip(counts.index.tolist(), counts.tolist())}
+
+
+COUNTING_APPROACHES = {
+    'simple': get_counts_simple,
+    'defaultdict': get_counts_defaultdict,
+    'Counter': get_counts_counter,
+    'numpy': get_counts_numpy,
+    'pandas': get_counts_pandas,
+}
+
+
+def select_counting_approach(sequence):
+    """The fastest approach for the type and size of sequence."""
+    if isinstance(getattr(sequence, 'dtype', None), pd.CategoricalDtype):
+        return 'numpy'
+    if isinstance(sequence, (np.ndarray, pd.Series)) and len(sequence) >= PANDAS_MIN_SIZE:
+        return 'pandas'
+    return 'Counter'
+
+
+def count_values(sequence, approach='Counter'):
+    """Count the values of sequence with one of COUNTING_APPROACHES, or 'auto' to select it."""
+    if approach == 'auto':
+        approach = select_counting_approach(sequence)
+    if approach not in COUNTING_APPROACHES:
+        raise ValueError("Invalid approach. Use 'simple', 'defaultdict', 'Counter', 'numpy', "
+                         "'pandas' or 'auto'.")
+    return COUNTING_APPROACHES[approach](sequence)
+
+
+def classify_user_agent(user_agent, os_families=OS_FAMILIES, other_os=OTHER_OS):
+    """OS family of one user agent string, with a plain substring test (no regex)."""
+    if isinstance(user_agent, str):
+        for family, substring in os_families.items():
+            if substring in user_agent:
+                return family
+    return other_os
+
+
+def classify_os(user_agents, os_families=OS_FAMILIES, other_os=OTHER_OS):
+    """
+    OS family of every user agent in a Series. Each distinct user agent is
+    classified once and the result is broadcast to the rows through the factorize codes.
+    """
+    codes, uniques = pd.factorize(user_agents)
+    # Code -1 (missing user agent) picks other_os appended at the end
+    families = np.array(
+        [classify_user_agent(ua, os_families, other_os) for ua in uniques] + [other_os],
+        dtype=object
+    )
+    return pd.Series(families[codes], index=user_agents.index)
+
 
 class USA_GOV:
 
@@ -17,16 +137,49 @@ class USA_GOV:
 
     def __init__(self, 
                  filepath='data/bitly_usagov/example.txt',
-                 fill=False):  # Fill missing values with 'Missing' or 'Unknown'
+                 fill=False,  # Fill missing values with 'Missing' or 'Unknown'
+                 streaming=False,  # Parse the lines in batches, keep only tz and a
+                 batch_size=100_000,  # Lines per batch in streaming mode
+                 verbose=False,  # Print the load throughput
+                 os_families=None,  # OS family -> user agent substring, OS_FAMILIES by default
+                 other_os=OTHER_OS):  # OS of the user agents that match no family
         
         # Default parameters
         self.filepath = filepath
         self.fill = fill    
+        self.streaming = streaming
+        self.batch_size = batch_size
+        self.verbose = verbose
+        self.os_families = os_families or OS_FAMILIES
+        self.other_os = other_os
 
         # Load the DataFrame
-        self.records = self._load_data()
-        self.records_df = self._convert_to_df(fill=fill)
-        self.decomposed_os = self._decompose_windows_users()
+        start = time.perf_counter()
+        if streaming:
+            # No list of dicts: records_df only has the tz and a columns
+            self.records = None
+            df, missing = self._load_fields()
+            tz_missing = missing[self.TZ].to_numpy()
+        else:
+            self.records = self._load_data()
+            df = pd.DataFrame(self.records)
+            tz_missing = np.fromiter((self.TZ not in rec for rec in self.records),
+                                     dtype=bool, count=len(self.records))
+        # Time zones of the records that have the key, counted by count_time_zones.
+        # In streaming mode a categorical, that stays small next to records_df
+        self.time_zones = df[self.TZ][~tz_missing]
+        if streaming:
+            self.time_zones = self.time_zones.astype('category')
+        self.records_df = self._convert_to_df(df, fill=fill)
+        # With fill, only the filled frame is kept
+        del df
+        self.load_time = time.perf_counter() - start
+        self.lines_per_sec = len(self.records_df) / self.load_time if self.load_time else float('inf')
+        if verbose:
+            print(f'{len(self.records_df):,} lines in {self.load_time:.2f} s '
+                  f'({self.lines_per_sec:,.0f} lines/sec)')
+
+        self.decomposed_os = self._decompose_os()
         self.pivot_os = self._get_pivot_os()
 
     def _load_data(self):
@@ -35,9 +188,36 @@ class USA_GOV:
             records = [json.loads(line) for line in f]
 
         return records
+
+    def _load_fields(self, fields=(TZ, A)):
+        """
+        Parse the file in batches of self.batch_size lines and keep only the given fields.
+        Missing fields become NaN, as in pd.DataFrame(records). Also returns a boolean
+        frame, True where the record has no such key (a null value is not missing).
+        """
+        batches = {field: [] for field in fields}
+        missing = {field: [] for field in fields}
+        with open(self.filepath, 'rb') as f:
+            while True:
+                lines = list(islice(f, self.batch_size))
+                if not lines:
+                    break
+                records = [json_loads(line) for line in lines if line.strip()]
+                for field in fields:
+                    values = np.empty(len(records), dtype=object)
+                    values[:] = [rec.get(field, np.nan) for rec in records]
+                    batches[field].append(values)
+                    missing[field].append(np.fromiter((field not in rec for rec in records),
+                                                      dtype=bool, count=len(records)))
+
+        def concat(arrays, dtype):
+            return np.concatenate(arrays) if arrays else np.array([], dtype=dtype)
+
+        fields_df = pd.DataFrame({field: concat(batches[field], object) for field in fields})
+        missing_df = pd.DataFrame({field: concat(missing[field], bool) for field in fields})
+        return fields_df, missing_df
     
-    def _convert_to_df(self, fill=False):
-        df = pd.DataFrame(self.records)
+    def _convert_to_df(self, df, fill=False):
         if fill:
             df = df.fillna('Missing')
             df[self.TZ] = df[self.TZ].replace('', 'Unknown')
@@ -47,46 +227,21 @@ class USA_GOV:
                          approach='Counter', 
                          top=None):
 
-        # Simple version
-        def get_counts_simple(sequence):
-            counts = {}
-            for x in sequence:
-                if x in counts:
-                    counts[x] += 1
-                else:
-                    counts[x] = 1
-            return counts
-
-        # Using defaultdict
-        def get_counts_defaultdict(sequence):
-            counts = defaultdict(int)
-            for x in sequence:
-                counts[x] += 1
-            return counts
-        
-        # Using Counter from collections
-        def get_counts_counter(sequence):
-            return Counter(sequence)
-        
-        time_zones = [rec['tz'] for rec in self.records if 'tz' in rec]
-
-        # Select the counting approach
-        if approach == 'simple':
-            get_counts = get_counts_simple
-        elif approach == 'defaultdict':
-            get_counts = get_counts_defaultdict
-        elif approach == 'Counter':
-            get_counts = get_counts_counter
-        else:
-            raise ValueError("Invalid approach. Use 'simple', 'defaultdict', or 'Counter'.")
+        # 'auto' counts a large Series with pandas, or the categorical with numpy
+        if approach == 'auto':
+            approach = select_counting_approach(self.time_zones)
+        time_zones = self.time_zones
+        if approach in ('simple', 'defaultdict', 'Counter'):
+            # The python approaches loop over a list, with None for a null tz
+            time_zones = time_zones.astype(object).where(time_zones.notna(), None).tolist()
 
         # If top is specified, return only the top N time zones
         if top is not None:
-            counts = get_counts(time_zones)
+            counts = count_values(time_zones, approach)
             sorted_counts = sorted(counts.items(), key=lambda x: x[1], reverse=True)
             return dict(sorted_counts[:top])
 
-        return get_counts(time_zones)
+        return count_values(time_zones, approach)
     
     def count_time_zones_pandas(self):
         return self.records_df[self.TZ].value_counts().sort_values(ascending=False)
@@ -105,19 +260,18 @@ class USA_GOV:
         user_agents = self.records_df[self.A].str.split().str[0]
         return user_agents.value_counts().sort_values(ascending=False)
     
-    def _decompose_windows_users(self):
+    def _decompose_os(self):
 
-        # Copy the dataframe
-        if self.fill:
-            df = self.records_df.copy()
-        else:
-            df = self._convert_to_df(fill=True)
-
-        # Create a new column 'os' based on whether 'Windows' is in the user agent string
-        os_map = {True: 'Windows', False: 'Not Windows'}
-        df[self.OS] = df[self.A].str.contains('Windows').map(os_map)
+        # Only the time zone (filled as in _convert_to_df) is needed besides the OS
+        time_zones = self.records_df[self.TZ]
+        if not self.fill:
+            time_zones = time_zones.fillna('Missing').replace('', 'Unknown')
 
-        return df
+        # Create a new column 'os' with the OS family found in the user agent string
+        return pd.DataFrame({
+            self.TZ: time_zones,
+            self.OS: classify_os(self.records_df[self.A], self.os_families, self.other_os)
+        })
 
     def _get_pivot_os(self):
         df = self.decomposed_os
@@ -164,9 +318,128 @@ class USA_GOV:
         # Melt pivot_os to long format
         long_df = long_pivot.reset_index().melt(
             id_vars=self.TZ, 
-            value_vars=['Not Windows', 'Windows'], 
+            value_vars=list(long_pivot.columns), 
             var_name=self.OS, 
             value_name='count'
         )
 
-        return long_df
\ No newline at end of file
+        return long_df
+
+class USA_GOVTail:
+    """
+    Time zone, user agent and time zone x OS counts over a log file that keeps growing.
+    Each update() parses only the lines appended since the previous call.
+    """
+
+    # Column names
+    TZ = USA_GOV.TZ
+    OS = USA_GOV.OS
+    TOTAL = USA_GOV.TOTAL
+
+    def __init__(self,
+                 filepath='data/bitly_usagov/example.txt',
+                 batch_size=100_000,  # Lines parsed at once
+                 os_families=None,  # OS family -> user agent substring, OS_FAMILIES by default
+                 other_os=OTHER_OS):  # OS of the user agents that match no family
+
+        self.filepath = filepath
+        self.batch_size = batch_size
+        self.os_families = os_families or OS_FAMILIES
+        self.other_os = other_os
+        self._os_by_user_agent = {}  # Every distinct user agent is classified once
+        self.reset()
+        self.update()
+
+    def reset(self):
+        """Forget all counts and read the file from the beginning on the next update."""
+        self.position = 0  # Byte offset of the first line not read yet
+        self.lines = 0
+        self.tz_counts = Counter()  # As count_time_zones
+        self.ua_counts = Counter()  # As get_user_agents
+        self.tz_os_counts = defaultdict(Counter)  # tz -> {os: count}, as pivot_os
+
+    def update(self):
+        """
+        Count the complete lines appended since the last call and return their number.
+        A line still being written (no trailing newline) is left for the next call.
+        """
+        if os.path.getsize(self.filepath) < self.position:
+            # The file was truncated or rotated: start over
+            self.reset()
+
+        new_lines = 0
+        with open(self.filepath, 'rb') as f:
+            f.seek(self.position)
+            while True:
+                lines = list(islice(f, self.batch_size))
+                complete = [line for line in lines if line.endswith(b'\n')]
+                self._add_records([json_loads(line) for line in complete if line.strip()])
+                self.position += sum(len(line) for line in complete)
+                new_lines += len(complete)
+                if len(complete) < self.batch_size:
+                    break
+
+        self.lines += new_lines
+        return new_lines
+
+    def _add_records(self, records):
+        for rec in records:
+            tz = rec.get(self.TZ)
+            ua = rec.get(USA_GOV.A)
+            if self.TZ in rec:
+                self.tz_counts[tz] += 1
+            if isinstance(ua, str) and ua.split():
+                self.ua_counts[ua.split()[0]] += 1
+
+            # Same filling as the pivot of USA_GOV
+            if tz is None:
+                tz = 'Missing'
+            elif tz == '':
+                tz = 'Unknown'
+            os_name = self._os_by_user_agent.get(ua)
+            if os_name is None:
+                os_name = classify_user_agent(ua, self.os_families, self.other_os)
+                self._os_by_user_agent[ua] = os_name
+            self.tz_os_counts[tz][os_name] += 1
+
+    def follow(self, interval=5, callback=None, max_updates=None):
+        """
+        Tail the file: call update() every interval seconds, then callback(self) if given.
+        Runs until interrupted or after max_updates updates.
+        """
+        updates = 0
+        try:
+            while max_updates is None or updates < max_updates:
+                if updates > 0:
+                    time.sleep(interval)
+                self.update()
+                if callback is not None:
+                    callback(self)
+                updates += 1
+        except KeyboardInterrupt:
+            pass
+
+    @staticmethod
+    def _top(counts, top):
+        # A heap of size top, no need to sort all the keys
+        return dict(heapq.nlargest(top, counts.items(), key=lambda item: item[1]))
+
+    def top_time_zones(self, top=10):
+        return self._top(self.tz_counts, top)
+
+    def top_user_agents(self, top=10):
+        return self._top(self.ua_counts, top)
+
+    def get_pivot_os(self, top=None):
+        """The time zone x OS pivot in the format of USA_GOV.pivot_os, optionally only the top time zones."""
+        totals = {tz: sum(counts.values()) for tz, counts in self.tz_os_counts.items()}
+        time_zones = self._top(totals, top) if top is not None else totals
+        pivot = pd.DataFrame.from_dict(
+            {tz: self.tz_os_counts[tz] for tz in time_zones}, orient='index'
+        ).fillna(0).astype(int)
+        pivot = pivot.reindex(columns=sorted(pivot.columns))
+        pivot.index.name = self.TZ
+        pivot.columns.name = self.OS
+        pivot[self.TOTAL] = pivot.sum(axis=1)
+
+        return pivot.sort_values(by=self.TOTAL, ascending=False)
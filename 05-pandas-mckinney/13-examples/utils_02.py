@@ -1,8 +1,95 @@
+import csv
+import io
+
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 sns.set_theme()
 
+import sys
+from pathlib import Path
+
+# utils_common lives at the repository root, searched after the folder's own modules
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+from utils_common import load_cached, lazy_table, materialize, MultiValueColumn
+
+
+class SeparatorTranslator(io.RawIOBase):
+    """
+    Binary stream over a file that replaces a multi-character separator with a
+    single byte while reading, so that the C parser can read '::'-delimited files.
+    Reads the file in chunks; a separator split across two chunks is carried over.
+    """
+
+    REPLACEMENT = '\x1f'  # ASCII unit separator, never present in the .dat files
+
+    def __init__(self, filepath, sep, chunksize=1 << 20):
+        self._file = open(filepath, 'rb')
+        self._sep = sep.encode('utf-8')
+        self._replacement = self.REPLACEMENT.encode('utf-8')
+        self._chunksize = chunksize
+        self._carry = b''  # Tail that may be the start of a separator
+        self._pending = b''  # Translated bytes not yet returned
+
+    def readable(self):
+        return True
+
+    def _fill(self):
+        chunk = self._file.read(self._chunksize)
+        if not chunk:
+            self._pending, self._carry = self._carry, b''
+            return
+        chunk = (self._carry + chunk).replace(self._sep, self._replacement)
+
+        # Keep back a trailing partial separator, it may complete in the next chunk
+        self._carry = b''
+        for k in range(len(self._sep) - 1, 0, -1):
+            if chunk.endswith(self._sep[:k]):
+                chunk, self._carry = chunk[:-k], chunk[-k:]
+                break
+        self._pending = chunk
+
+    def readinto(self, buffer):
+        while not self._pending:
+            self._fill()
+            if not self._pending and not self._carry:
+                return 0  # End of file
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+def read_dat(filepath, names, sep='::', engine='c', dtype=None):
+    """
+    Read a headerless .dat file. A multi-character separator is only supported by
+    the python engine, so for engine='c' it is translated to a single byte on the fly.
+    """
+    if engine == 'c' and len(sep) > 1:
+        with io.BufferedReader(SeparatorTranslator(filepath, sep)) as f:
+            return pd.read_csv(f,
+                               sep=SeparatorTranslator.REPLACEMENT,
+                               header=None,
+                               names=names,
+                               dtype=dtype,
+                               quoting=csv.QUOTE_NONE,  # Titles may start with '"'
+                               engine='c')
+
+    return pd.read_csv(filepath, 
+                       sep=sep, 
+                       header=None, 
+                       names=names,
+                       dtype=dtype,
+                       engine=engine)
+
+
 class MovieLens:
 
     # Column names
@@ -22,6 +109,23 @@ class MovieLens:
     TITLE = 'title'
     GENRES = 'genres'
 
+    # Compact dtypes used with compact=True
+    DTYPES = {
+        USER_ID: 'int32',
+        GENDER: 'category',
+        AGE: 'int8',
+        OCCUPATION: 'int8',
+        MOVIE_ID: 'int32',
+        RATING: 'int8',
+        GENRES: 'category',
+    }
+
+    # Per-movie statistics (movie_stats), with COUNT and SUM also per gender, e.g. 'count_F'
+    COUNT = 'count'
+    SUM = 'sum'
+    SUMSQ = 'sumsq'  # Sum of squared ratings
+    MEAN = 'mean'
+
     # Miscellaneous
     M = 'M'
     F = 'F'
@@ -32,7 +136,9 @@ class MovieLens:
                  ratings_filepath='data/movielens/ratings.dat',
                  movies_filepath='data/movielens/movies.dat',
                  sep='::',
-                 engine='python'):  # Separator and engine for reading .dat files
+                 engine='c',  # Separator and engine for reading .dat files
+                 compact=False,  # Use the compact dtypes from DTYPES
+                 cache_dir=None):  # Cache the parsed data as Parquet (see utils_common)
         
         # Default parameters
         self.users_filepath = users_filepath
@@ -40,43 +146,62 @@ class MovieLens:
         self.movies_filepath = movies_filepath
         self.sep = sep
         self.engine = engine
+        self.compact = compact
+        self.cache_dir = cache_dir
 
         # Load the DataFrames
-        self.users = self._load_users()
-        self.ratings = self._load_ratings()
-        self.movies = self._load_movies()
-        self.data = self._merge_data()
-        self.data_by_genre = self._merge_data(by_genre=True)
+        self.users = load_cached(self._load_users, [self.users_filepath], self.cache_dir,
+                                 sep=self.sep, compact=self.compact)
+        self.ratings = load_cached(self._load_ratings, [self.ratings_filepath], self.cache_dir,
+                                   sep=self.sep, compact=self.compact)
+        self.movies = load_cached(self._load_movies, [self.movies_filepath], self.cache_dir,
+                                  sep=self.sep, compact=self.compact)
+
+    # Merged tables, computed on first access
+    @lazy_table('users', 'ratings', 'movies')
+    def data(self):
+        return self._merge_data()
+
+    @lazy_table('users', 'ratings', 'movies')
+    def data_by_genre(self):
+        return self._merge_data(by_genre=True)
+
+    # Per-movie statistics, computed on first access
+    @lazy_table('users', 'ratings')
+    def movie_stats(self):
+        return self._get_movie_stats()
+
+    # Genres of each row of movies, without exploding them (see utils_common)
+    @lazy_table('movies')
+    def genres(self):
+        return MultiValueColumn(self.movies[self.GENRES], sep='|')
+
+    def materialize(self, *names, max_workers=None):
+        """
+        Compute the given merged tables (all of them by default) ahead of use, in parallel.
+        """
+        materialize(self, *names, max_workers=max_workers)
+
+    def _read_dat(self, filepath, names):
+        dtype = {col: self.DTYPES[col] for col in names if col in self.DTYPES} if self.compact else None
+        return read_dat(filepath, names, sep=self.sep, engine=self.engine, dtype=dtype)
 
     def _load_users(self):
         names = [self.USER_ID, self.GENDER, self.AGE, self.OCCUPATION, self.ZIP]
-        return pd.read_csv(self.users_filepath, 
-                           sep=self.sep, 
-                           header=None, 
-                           names=names,
-                           engine=self.engine)
+        return self._read_dat(self.users_filepath, names)
     
     def _load_ratings(self):
         names = [self.USER_ID, self.MOVIE_ID, self.RATING, self.TIMESTAMP]
-        return pd.read_csv(self.ratings_filepath, 
-                           sep=self.sep, 
-                           header=None, 
-                           names=names,
-                           engine=self.engine)
+        return self._read_dat(self.ratings_filepath, names)
 
     def _load_movies(self):
         names = [self.MOVIE_ID, self.TITLE, self.GENRES]
-        return pd.read_csv(self.movies_filepath, 
-                           sep=self.sep, 
-                           header=None, 
-                           names=names,
-                           engine=self.engine)
+        return self._read_dat(self.movies_filepath, names)
     
     def _merge_data(self, by_genre=False):
 
         # Merge users and ratings on user_id
-        data = pd.merge(self.ratings, self.users, on=self.USER_ID, how='left', indicator=True)
-        data = self._check_merge(data, 'users')
+        data = self._join_on_id(self.ratings, self.users, self.USER_ID, 'users')
 
         # Merge the result with movies on movie_id
         if by_genre:
@@ -84,10 +209,51 @@ class MovieLens:
         else :
             movies = self.movies
 
-        data = pd.merge(data, movies, on=self.MOVIE_ID, how='left', indicator=True)
-        data = self._check_merge(data, 'movies')
+        data = self._join_on_id(data, movies, self.MOVIE_ID, 'movies')
 
         return data
+
+    def _join_on_id(self, left, right, on, entity):
+        """
+        Same as pd.merge(left, right, on=on, how='left') followed by _check_merge, for
+        small non-negative integer ids: the rows of right are found with lookup arrays
+        indexed by id and gathered with take. Several rows of right may share an id
+        (e.g. exploded genres). Other keys go through pd.merge.
+        """
+        left_ids = left[on].to_numpy()
+        right_ids = right[on].to_numpy()
+        # Check the dtypes first, max() fails on string ids
+        use_lookup = (np.issubdtype(left_ids.dtype, np.integer)
+                      and np.issubdtype(right_ids.dtype, np.integer))
+        if use_lookup:
+            size = max(left_ids.max(initial=0), right_ids.max(initial=0)) + 1
+            use_lookup = (min(left_ids.min(initial=0), right_ids.min(initial=0)) >= 0
+                          and size <= 4 * (len(left) + len(right)))
+        if not use_lookup:
+            data = pd.merge(left, right, on=on, how='left', indicator=True)
+            return self._check_merge(data, entity)
+
+        # Rows of right sorted by id (stable, as merge keeps their order), first row and count per id
+        order = np.argsort(right_ids, kind='stable')
+        counts = np.bincount(right_ids, minlength=size)
+        starts = np.cumsum(counts) - counts
+
+        repeats = counts[left_ids]
+        missing = (repeats == 0).sum()
+        if missing:
+            raise ValueError(f"Some {entity} in the left DataFrame are missing. Count: {missing}")
+
+        if (repeats == 1).all():
+            left_rows = left.reset_index(drop=True)
+            right_positions = order[starts[left_ids]]
+        else:
+            # Left rows repeated once per matching right row
+            left_rows = left.take(np.repeat(np.arange(len(left)), repeats)).reset_index(drop=True)
+            offsets = np.repeat(starts[left_ids] - (np.cumsum(repeats) - repeats), repeats)
+            right_positions = order[offsets + np.arange(repeats.sum())]
+
+        right_rows = right.drop(columns=on).take(right_positions).reset_index(drop=True)
+        return pd.concat([left_rows, right_rows], axis=1)
     
     def _check_merge(self, df, entity):
         """
@@ -99,46 +265,176 @@ class MovieLens:
             raise ValueError(f"Some {entity} in the left DataFrame are missing. Count: {len(missing)}")
         return df.drop(columns=['_merge'])
 
-    def mean_ratings_by_gender(self, index=[MOVIE_ID, TITLE], active=False):
+    def _get_movie_stats(self):
+        """
+        Count, sum and sum of squares of the ratings of each movie, and count and sum
+        for each gender. Computed from ratings with np.bincount over the integer movie_id.
+        """
+        movie_ids = self.ratings[self.MOVIE_ID].to_numpy()
+        ratings = self.ratings[self.RATING].to_numpy(dtype=float)
+        genders = self.ratings[self.USER_ID].map(self.users.set_index(self.USER_ID)[self.GENDER])
+        genders = genders.to_numpy(dtype=object)
+        size = movie_ids.max() + 1 if len(movie_ids) else 0
+
+        stats = {
+            self.COUNT: np.bincount(movie_ids, minlength=size),
+            self.SUM: np.bincount(movie_ids, weights=ratings, minlength=size),
+            self.SUMSQ: np.bincount(movie_ids, weights=ratings ** 2, minlength=size),
+        }
+        for gender in sorted(pd.unique(genders[pd.notna(genders)])):
+            is_gender = genders == gender
+            stats[f'{self.COUNT}_{gender}'] = np.bincount(movie_ids[is_gender], minlength=size)
+            stats[f'{self.SUM}_{gender}'] = np.bincount(movie_ids[is_gender],
+                                                        weights=ratings[is_gender],
+                                                        minlength=size)
+
+        stats = pd.DataFrame(stats, index=pd.RangeIndex(size, name=self.MOVIE_ID))
+        return stats[stats[self.COUNT] > 0]
+
+    def _get_movie_index(self, movie_ids, index):
+        """
+        Index of the given movies with the columns in index, [MOVIE_ID] or [MOVIE_ID, TITLE],
+        as groupby would build it.
+        """
+        if index == [self.MOVIE_ID]:
+            return pd.Index(movie_ids, name=self.MOVIE_ID)
+        titles = self.movies.set_index(self.MOVIE_ID)[self.TITLE].reindex(movie_ids)
+        return pd.MultiIndex.from_arrays([movie_ids, titles.to_numpy()], names=index)
+
+    def _uses_movie_stats(self, index):
+        # movie_stats only knows about movies, other groupings go through data
+        return list(index) in ([self.MOVIE_ID], [self.MOVIE_ID, self.TITLE])
+
+    def mean_ratings_by_gender(self, index=[MOVIE_ID, TITLE], active=False, min_ratings=250):
         """
         Calculate the mean movie ratings for each film, grouped by gender using pivot table.
+        Grouping by movie uses the precomputed movie_stats.
         """
         
-        mean_ratings = pd.pivot_table(data=self.data, 
-                              index=index,
-                              columns=self.GENDER, 
-                              values=self.RATING, 
-                              aggfunc='mean')
+        if self._uses_movie_stats(index):
+            stats = self.movie_stats
+            genders = [col.split('_', 1)[1] for col in stats.columns if col.startswith(f'{self.COUNT}_')]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                means = {gender: stats[f'{self.SUM}_{gender}'] / stats[f'{self.COUNT}_{gender}']
+                         for gender in genders}
+            mean_ratings = pd.DataFrame(means).set_axis(
+                self._get_movie_index(stats.index.to_numpy(), list(index)), axis=0
+            )
+            mean_ratings.columns.name = self.GENDER
+        else:
+            mean_ratings = pd.pivot_table(data=self.data, 
+                                  index=index,
+                                  columns=self.GENDER, 
+                                  values=self.RATING, 
+                                  aggfunc='mean')
     
         if active:
-            active_titles = self.get_active_titles()
+            active_titles = self.get_active_titles(min_ratings, cols=index)
             mean_ratings = mean_ratings.loc[active_titles]
 
         return mean_ratings
 
+    def get_mean_ratings_diff(self, index=[MOVIE_ID, TITLE], active=True, min_ratings=250):
+        """
+        Mean ratings by gender with the difference between men and women (M - F).
+        """
+        mean_ratings = self.mean_ratings_by_gender(index=index, active=active, min_ratings=min_ratings)
+        mean_ratings[self.DIFF] = mean_ratings[self.M] - mean_ratings[self.F]
+        return mean_ratings
+
     def get_active_titles(self, min_ratings=250, cols=[MOVIE_ID, TITLE]):
         """
         Return movie titles that have received at least `min_ratings` ratings.
         """
+        if self._uses_movie_stats(cols):
+            counts = self.movie_stats[self.COUNT]
+            return self._get_movie_index(counts.index[counts >= min_ratings].to_numpy(), list(cols))
+
         rating_counts = self.data.groupby(cols).size()
         active_titles = rating_counts.index[rating_counts >= min_ratings]
         return active_titles
     
-    def get_titles_with_disagreement(self, index=[MOVIE_ID, TITLE], active=True, n=10):
+    def get_titles_with_disagreement(self, index=[MOVIE_ID, TITLE], active=True, n=10, min_ratings=250):
         """
         Return the top `n` movie titles with the highest disagreement in ratings.
         """
 
-        # Group by movie and title, then calculate std deviation of ratings
-        std_ratings = self.data.groupby(index)[self.RATING].std()
+        if self._uses_movie_stats(index):
+            # Sample std deviation from count, sum and sum of squares
+            stats = self.movie_stats
+            count, total, sumsq = stats[self.COUNT], stats[self.SUM], stats[self.SUMSQ]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                variance = (count * sumsq - total ** 2) / (count * (count - 1))
+            std_ratings = pd.Series(np.sqrt(variance.clip(lower=0)).to_numpy(),
+                                    index=self._get_movie_index(stats.index.to_numpy(), list(index)),
+                                    name=self.RATING)
+        else:
+            # Group by movie and title, then calculate std deviation of ratings
+            std_ratings = self.data.groupby(index)[self.RATING].std()
 
         if active:
-            active_titles = self.get_active_titles()
+            active_titles = self.get_active_titles(min_ratings, cols=index)
             std_ratings = std_ratings.loc[active_titles]
 
         most_disagreement = std_ratings.sort_values(ascending=False)
         return most_disagreement.head(n)
     
+    def get_genre_stats(self, by=None):
+        """
+        Count, sum and mean of the ratings by genre, and by the users column `by`
+        (e.g. GENDER or AGE) if given: data_by_genre.groupby([GENRES, by])[RATING]
+        without the exploded join. Ratings are summed per movie first, then per
+        genre through the genres encoding.
+        """
+        # Row in movies of every rating, with a lookup array indexed by movie_id
+        movie_ids = self.movies[self.MOVIE_ID].to_numpy()
+        rating_movie_ids = self.ratings[self.MOVIE_ID].to_numpy()
+        movie_rows = np.full(max(movie_ids.max(), rating_movie_ids.max()) + 1, -1)
+        movie_rows[movie_ids] = np.arange(len(movie_ids))
+        rows = movie_rows[rating_movie_ids]
+        if (rows < 0).any():
+            raise ValueError(f"Some movies in the left DataFrame are missing. Count: {(rows < 0).sum()}")
+
+        if by is None:
+            by_codes, by_values = np.zeros(len(rows), dtype=int), [None]
+        else:
+            user_values = self.ratings[self.USER_ID].map(self.users.set_index(self.USER_ID)[by])
+            by_codes, by_values = pd.factorize(user_values, sort=True)
+            if (by_codes < 0).any():
+                raise ValueError(f"Some users in the left DataFrame are missing. Count: {(by_codes < 0).sum()}")
+
+        # Count and sum per movie (and `by` value)
+        shape = (len(movie_ids), len(by_values))
+        keys = rows * shape[1] + by_codes
+        counts = np.bincount(keys, minlength=shape[0] * shape[1]).reshape(shape)
+        sums = np.bincount(keys, weights=self.ratings[self.RATING].to_numpy(dtype=float),
+                           minlength=shape[0] * shape[1]).reshape(shape)
+
+        # Then per genre, in the order of groupby
+        stats = pd.DataFrame({
+            self.COUNT: self.genres.aggregate(counts).astype(int).ravel(),
+            self.SUM: self.genres.aggregate(sums).ravel(),
+        })
+        stats[self.MEAN] = stats[self.SUM] / stats[self.COUNT]
+        if by is None:
+            stats.index = self.genres.values.rename(self.GENRES)
+        else:
+            stats.index = pd.MultiIndex.from_product(
+                [self.genres.values, np.asarray(by_values)], names=[self.GENRES, by]
+            )
+        return stats[stats[self.COUNT] > 0]
+
+    def mean_ratings_by_genre(self, by=GENDER):
+        """
+        Mean rating for each genre (rows) and value of the users column `by` (columns),
+        as data_by_genre.pivot_table(index=GENRES, columns=by, values=RATING).
+        """
+        return self.get_genre_stats(by)[self.MEAN].unstack(by)
+
+    def count_ratings_by_genre(self):
+        """Number of ratings for each genre, as data_by_genre.groupby(GENRES).size()."""
+        return self.get_genre_stats()[self.COUNT]
+
     def _explode_genre(self):
 
         movies = self.movies.copy()
@@ -1,9 +1,22 @@
+import os
+import re
+
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 sns.set_theme()
 
+import sys
+from pathlib import Path
+
+# utils_common lives at the repository root, searched after the folder's own modules
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+from utils_common import (read_files_parallel, load_cached, top_n_by_group,
+                          lazy_table, materialize, invalidate, get_materialized)
+
 
 class BabyNames:
 
@@ -21,48 +34,164 @@ class BabyNames:
     def __init__(self, 
                  directory='data/babynames/',
                  col_names=[NAME, SEX, BIRTHS],
-                 years=range(1880, 2011)):  # Column names
+                 years=range(1880, 2011),
+                 executor='thread',  # 'thread', 'process' or 'serial'
+                 max_workers=None,
+                 verbose=False,  # Print the parse time per file
+                 cache_dir=None):  # Cache the parsed data as Parquet (see utils_common)
         
         self.directory = directory
         self.col_names = col_names
         self.years = years
+        self.executor = executor
+        self.max_workers = max_workers
+        self.verbose = verbose
+        self.cache_dir = cache_dir
+        self.load_times = {}  # Stays empty when the data comes from the cache
+
+        # Load the data; the derived tables below are computed on first access
+        self.names = load_cached(self._load_data, self._get_paths(), self.cache_dir,
+                                 col_names=self.col_names, years=list(self.years))
+        self._diversity = {}  # Diversity table per quantile, filled by get_diversity()
+
+    @lazy_table('names')
+    def total_births(self):
+        return self._get_total_births(self.names)
+
+    @lazy_table('names')
+    def names_with_prop(self):
+        return self._add_prop(self.names)
+
+    @lazy_table('names_with_prop')
+    def top1000(self):
+        return self._get_top1000(self.names_with_prop)
+
+    @lazy_table('top1000')
+    def boys(self):
+        return self._split_into_boys_girls(self.top1000)[0]
 
-        # Load the data
-        self.names = self._load_data()
-        self.total_births = self._get_total_births()
-        self.names_with_prop = self._add_prop()
-        self.top1000 = self._get_top1000()
-        self.boys, self.girls = self._split_into_boys_girls()
-        self.names[self.LAST_LETTER] = self.names[self.NAME].str[-1]
+    @lazy_table('top1000')
+    def girls(self):
+        return self._split_into_boys_girls(self.top1000)[1]
+
+    @lazy_table('names')
+    def last_letter(self):
+        # Last letter of every name, aligned with self.names
+        return self.names[self.NAME].str[-1].rename(self.LAST_LETTER)
+
+    def materialize(self, *names, max_workers=None):
+        """
+        Compute the given derived tables (all of them by default) ahead of use,
+        independent ones in parallel.
+        """
+        materialize(self, *names, max_workers=max_workers)
+
+    def _get_paths(self, years=None):
+        years = self.years if years is None else years
+        return [f'{self.directory}yob{year}.txt' for year in years]
 
     def _load_data(self):
+        return self._read_years(self.years)
+
+    def _read_years(self, years):
         
-        # List to hold the yearly DataFrames
-        pieces = []
+        # Parse the yearly files in parallel, in the order of years
+        paths = self._get_paths(years)
+        pieces, load_times = read_files_parallel(paths,
+                                                 executor=self.executor,
+                                                 max_workers=self.max_workers,
+                                                 verbose=self.verbose,
+                                                 names=self.col_names)
+        self.load_times.update(load_times)
 
-        # Load each year's data and append to pieces
-        for year in self.years:
-            path = f'{self.directory}yob{year}.txt'
-            df = pd.read_csv(path, names=self.col_names)
+        # Add the year to each piece
+        for year, df in zip(years, pieces):
             df[self.YEAR] = year
-            pieces.append(df)
 
         # Concatenate all pieces into a single DataFrame
         return pd.concat(pieces, ignore_index=True)
 
-    def _get_total_births(self):
-        return pd.pivot_table(data=self.names,
+    def add_year(self, year):
+        """
+        Parse yob{year}.txt and update every derived table for that year only,
+        instead of recomputing them across all years.
+        """
+        self._add_years([year])
+
+    def refresh(self):
+        """
+        Add every yobYYYY.txt file in the directory whose year is not loaded yet.
+        Returns the list of added years.
+        """
+        loaded = set(self.years)
+        new_years = sorted(year for year in self._get_available_years() if year not in loaded)
+        if new_years:
+            self._add_years(new_years)
+        return new_years
+
+    def _get_available_years(self):
+        years = []
+        for filename in os.listdir(self.directory):
+            match = re.fullmatch(r'yob(\d{4})\.txt', filename)
+            if match:
+                years.append(int(match.group(1)))
+        return years
+
+    def _add_years(self, years):
+        for year in years:
+            if year in self.years:
+                raise ValueError(f"Year {year} is already loaded.")
+
+        new = self._read_years(years)
+        self.years = sorted(list(self.years) + list(years))
+
+        # Every (year, sex) group of the new rows is new, so the derived tables
+        # for them are computed from the new rows alone and appended.
+        # Tables that were never computed stay lazy.
+        computed = get_materialized(self)
+        new_with_prop = self._add_prop(new)
+        new_top1000 = self._get_top1000(new_with_prop)
+
+        if 'total_births' in computed:
+            self.total_births = pd.concat([self.total_births, self._get_total_births(new)]).sort_index()
+        if 'names_with_prop' in computed:
+            self.names_with_prop = self._append_years(self.names_with_prop, new_with_prop)
+        if 'top1000' in computed:
+            self.top1000 = self._append_years(self.top1000, new_top1000)
+            # Boolean filters of top1000, their index follows the top1000 index
+            invalidate(self, 'boys', 'girls')
+        # The row positions of names may change, recompute last_letter when needed
+        invalidate(self, 'last_letter')
+        self.names = self._append_years(self.names, new)
+
+        if self._diversity:
+            new_diversity = self._compute_diversity(new_top1000, list(self._diversity))
+            for q, table in new_diversity.items():
+                self._diversity[q] = pd.concat([self._diversity[q], table]).sort_index()
+
+    def _append_years(self, df, new):
+        """
+        Append the rows of new years, keeping the rows ordered by year as a full load does.
+        """
+        in_order = df.empty or new[self.YEAR].min() > df[self.YEAR].max()
+        combined = pd.concat([df, new], ignore_index=True)
+        if not in_order:
+            combined = combined.sort_values(self.YEAR, kind='stable', ignore_index=True)
+        return combined
+
+    def _get_total_births(self, names):
+        return pd.pivot_table(data=names,
                               index=self.YEAR,
                               columns=self.SEX,
                               values=self.BIRTHS,
                               aggfunc='sum')
     
-    def _add_prop(self):
+    def _add_prop(self, names):
         # Use transform for an efficient, non-ambiguous calculation
-        prop = self.names.groupby([self.YEAR, self.SEX])[self.BIRTHS].transform(lambda x: x / x.sum())
+        prop = names.groupby([self.YEAR, self.SEX])[self.BIRTHS].transform(lambda x: x / x.sum())
         
         # Add the new 'prop' column to a copy of the original DataFrame
-        names_with_prop = self.names.copy()
+        names_with_prop = names.copy()
         names_with_prop[self.PROP] = prop
         return names_with_prop
 
@@ -85,20 +214,16 @@ class BabyNames:
         else:
             raise ValueError("Method must be 'pd' or 'sns'")
         
-    def _get_top1000(self):
-        # Function to get top 1000 names for each year/sex combination
-        def get_top1000(group):
-            return group.nlargest(1000, self.BIRTHS)
-        return (self.names_with_prop
-                .groupby([self.YEAR, self.SEX])
-                .apply(get_top1000)
+    def _get_top1000(self, names_with_prop):
+        # Top 1000 names for each year/sex combination, with a single sort
+        return (top_n_by_group(names_with_prop, [self.YEAR, self.SEX], self.BIRTHS, 1000)
                 .reset_index(drop=True)
                 )
     
-    def _split_into_boys_girls(self):
+    def _split_into_boys_girls(self, top1000):
         # Split the top1000 names into boys and girls
-        boys = self.top1000[self.top1000[self.SEX] == self.M]
-        girls = self.top1000[self.top1000[self.SEX] == self.F]
+        boys = top1000[top1000[self.SEX] == self.M]
+        girls = top1000[top1000[self.SEX] == self.F]
         return boys, girls
     
     def plot_top_names(self, names=['Anna', 'Emma', 'Elizabeth'],
@@ -151,32 +276,53 @@ class BabyNames:
         else:
             raise ValueError("Method should be 'pd' or 'sns'...")
         
-    def get_diversity(self):
+    def get_diversity(self, q=0.5):
         """
         Compute number of distinct names, taken in order of popularity 
-        from highest to lowest, in the top 50% of births.
+        from highest to lowest, in the top q share of births (50% by default).
+        q can be a list of quantiles, e.g. [0.25, 0.5, 0.9], computed in one pass;
+        the result then has (q, sex) columns.
+        Results are kept per quantile and updated by add_year() and refresh().
         """
+        quantiles = list(q) if np.ndim(q) else [q]
+        missing = [quantile for quantile in quantiles if quantile not in self._diversity]
+        if missing:
+            self._diversity.update(self._compute_diversity(self.top1000, missing))
 
-        def get_quantile_count(group, q=0.5):
-
-            # Sort by proportion in descending order
-            sorted_group = group.sort_values(by=self.PROP, ascending=False)
+        if np.ndim(q):
+            return pd.concat({quantile: self._diversity[quantile] for quantile in quantiles},
+                             axis=1, names=['q'])
+        return self._diversity[q]
 
-            # Compute cumulative sum of proportions
-            sorted_group[self.CUMSUM] = sorted_group[self.PROP].cumsum()
+    def _compute_diversity(self, top1000, quantiles):
+        """
+        Return {q: diversity table} with a single sort of top1000 by year, sex and
+        descending prop, and a cumulative sum per (year, sex) group.
+        """
+        keys = [self.YEAR, self.SEX]
+        df = top1000.sort_values(keys + [self.PROP], ascending=[True, True, False])
 
-            # Find the number of distinct names in the top quantile
-            n = sorted_group[sorted_group[self.CUMSUM] <= q].shape[0]
+        # Group numbers follow the sorted keys, so every group is a contiguous segment
+        grouped = df.groupby(keys, sort=True)
+        group_ids = grouped.ngroup().to_numpy()
+        sizes = grouped.size()
+        index = sizes.index
 
-            # Add 1 to include the name that crosses the threshold
-            return n + 1  
+        # Plain running sum of each segment, as Series.cumsum computes it. groupby's
+        # cumsum is compensated (Kahan) and can land on the other side of q when the
+        # top names add up to exactly q, which changes the count by one.
+        prop = df[self.PROP].to_numpy()
+        bounds = np.concatenate([[0], np.cumsum(sizes.to_numpy())])
+        cumsum = np.concatenate([np.cumsum(prop[start:stop])
+                                 for start, stop in zip(bounds[:-1], bounds[1:])])
 
-        # Group top1000 names by year and sex and apply the function
-        diversity = (self.top1000
-                     .groupby([self.YEAR, self.SEX])
-                     .apply(get_quantile_count)
-                     )
-        return diversity.unstack()
+        diversity = {}
+        for q in quantiles:
+            # Number of names within the quantile, plus the name that crosses it
+            counts = np.bincount(group_ids, weights=cumsum <= q, minlength=len(index))
+            counts = pd.Series(counts.astype(np.int64) + 1, index=index)
+            diversity[q] = counts.unstack()
+        return diversity
     
     def plot_diversity(self,
                        title="Number of Distinct Names in Top 50% of Births",
@@ -192,7 +338,7 @@ class BabyNames:
                                 letters=["d", "n", "y"],
                                 sex=M):
         # Create pivot table: index=LAST_LETTER, columns=[YEAR, SEX], values=BIRTHS
-        table = self.names.pivot_table(index=self.LAST_LETTER,
+        table = self.names.pivot_table(index=self.last_letter,
                                         columns=[self.YEAR, self.SEX],
                                         values=self.BIRTHS,
                                         aggfunc='sum')
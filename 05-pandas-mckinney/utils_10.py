@@ -3,8 +3,17 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 sns.set_theme()
 
+import sys
+from pathlib import Path
 
-class Tips:
+# utils_common lives at the repository root, searched after the folder's own modules
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+from utils_common import load_cached, top_n_by_group, MemoryReportMixin
+
+
+class Tips(MemoryReportMixin):
 
     # Class variables: total_bill,tip,smoker,day,time,size,tip_pct
     TOTAL_BILL = "total_bill"
@@ -15,18 +24,33 @@ class Tips:
     SIZE = "size"
     TIP_PCT = "tip_pct"  # Tip as a percentage of total bill
 
+    # Compact dtypes used with compact=True
+    DTYPES = {
+        TOTAL_BILL: 'float32',
+        TIP: 'float32',
+        SMOKER: 'category',
+        DAY: 'category',
+        TIME: 'category',
+        SIZE: 'int8',
+    }
+
     def __init__(self, 
-                 filepath='data/tips.csv'):  # File path to the CSV file
+                 filepath='data/tips.csv',  # File path to the CSV file
+                 compact=False,  # Use the compact dtypes from DTYPES
+                 cache_dir=None):  # Cache the parsed data as Parquet (see utils_common)
         
         self.filepath = filepath
+        self.compact = compact
+        self.cache_dir = cache_dir
 
         # Load the data
-        self.tips = self._load_data()
+        self.tips = load_cached(self._load_data, [self.filepath], self.cache_dir,
+                                compact=self.compact)
 
     def _load_data(self):
 
         # Load the CSV file into a DataFrame
-        df = pd.read_csv(self.filepath)
+        df = pd.read_csv(self.filepath, dtype=self.DTYPES if self.compact else None)
 
         # Add tip percentage column
         df[self.TIP_PCT] = df[self.TIP] / df[self.TOTAL_BILL]
@@ -41,8 +65,9 @@ class Tips:
                           group_by=SMOKER,
                           n=5):
         """Select the top n tip_pct values by group."""
-        
-        def top_n(group, column=self.TIP_PCT, n=n):
-            return group.nlargest(n, columns=column)
-        
-        return self.tips.groupby(group_by).apply(top_n)
\ No newline at end of file
+        top = top_n_by_group(self.tips, group_by, self.TIP_PCT, n)
+
+        # Index by group key(s) and original row label, as groupby().apply() does
+        keys = [group_by] if isinstance(group_by, str) else list(group_by)
+        top.index = pd.MultiIndex.from_arrays([top[key] for key in keys] + [top.index])
+        return top
@@ -2,10 +2,33 @@
 Script to clean text copied from Apple Books.
 Removes quotes around problem descriptions and "Excerpt From..." attribution.
 Formats the output with proper line wrapping.
+
+With --stream the input may hold many problems, each one followed by its own
+"Excerpt From..." attribution (e.g. a whole chapter). They are read, cleaned
+and written one at a time. The input may also be a directory of raw files,
+processed in parallel.
+
+Usage:
+    python problems_cleaner.py
+    python problems_cleaner.py --stream chapter_raw.txt chapter_clean.txt
+    python problems_cleaner.py --stream raw_dir/ clean_dir/
 """
 
+import argparse
+import os
 import re
 import textwrap
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# "Excerpt From..." attribution that Apple Books appends to every copied excerpt
+EXCERPT_PATTERN = re.compile(
+    r'Excerpt From.*?This material may be protected by copyright\.',
+    flags=re.DOTALL
+)
+
+# Title like "22. Title" or "22.Title" or "22 .Title"
+TITLE_PATTERN = re.compile(r'^(\d+)\s*\.\s*')
 
 
 def wrap_text(text, width=80):
@@ -40,12 +63,7 @@ def clean_apple_books_text(text):
         Cleaned text with quotes and attribution removed, properly formatted
     """
     # Remove the "Excerpt From..." section (from "Excerpt From" to end)
-    text = re.sub(
-        r'Excerpt From.*?This material may be protected by copyright\.',
-        '',
-        text,
-        flags=re.DOTALL
-    )
+    text = EXCERPT_PATTERN.sub('', text)
     
     # Remove smart quotes (curly quotes) around the problem description
     # Apple Books uses UTF-8 smart quotes: " (U+201C) and " (U+201D)
@@ -69,7 +87,7 @@ def clean_apple_books_text(text):
     
     # Ensure title format: number. Title (with single space after dot)
     # Match pattern like "22. Title" or "22.Title" or "22 .Title"
-    title = re.sub(r'^(\d+)\s*\.\s*', r'\1. ', title)
+    title = TITLE_PATTERN.sub(r'\1. ', title)
     
     # Wrap content to 80 characters
     wrapped_content = wrap_text(content, width=80)
@@ -78,18 +96,101 @@ def clean_apple_books_text(text):
     return f"{title}\n{wrapped_content}"
 
 
+def iter_problems(lines):
+    """
+    Split raw text into problems while reading it.
+    
+    Args:
+        lines: Iterable of lines, e.g. an open file
+        
+    Yields:
+        Raw text of each problem, up to and including its "Excerpt From..."
+        attribution, then the text after the last attribution (if any)
+    """
+    buffer = ''
+    for line in lines:
+        buffer += line
+        # Only the current problem is kept in memory
+        match = EXCERPT_PATTERN.search(buffer)
+        while match:
+            yield buffer[:match.end()]
+            buffer = buffer[match.end():]
+            match = EXCERPT_PATTERN.search(buffer)
+    
+    if buffer.strip():
+        yield buffer
+
+
+def clean_file(input_path, output_path):
+    """
+    Clean every problem of a raw file and write them to output_path as they are
+    read, separated by a blank line.
+    
+    Returns:
+        Number of problems written
+    """
+    count = 0
+    with open(input_path, 'r', encoding='utf-8') as f_in, \
+            open(output_path, 'w', encoding='utf-8') as f_out:
+        for problem in iter_problems(f_in):
+            cleaned_text = clean_apple_books_text(problem)
+            if not cleaned_text:
+                continue
+            f_out.write(('\n\n' if count else '') + cleaned_text)
+            count += 1
+    return count
+
+
+def clean_directory(input_dir, output_dir, pattern='*.txt', max_workers=None):
+    """
+    Clean every raw file of input_dir matching pattern into a file with the same
+    name in output_dir, one file per process.
+    
+    Returns:
+        Dictionary of file name -> number of problems written
+    """
+    input_paths = sorted(Path(input_dir).glob(pattern))
+    os.makedirs(output_dir, exist_ok=True)
+    output_paths = [Path(output_dir) / path.name for path in input_paths]
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        counts = pool.map(clean_file, input_paths, output_paths)
+        return {path.name: count for path, count in zip(input_paths, counts)}
+
+
 def main():
     """Read from problems_raw.txt and write cleaned text to problems_clean.txt"""
     
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('input', nargs='?', default='problems_raw.txt',
+                        help='raw file, or directory of raw files with --stream')
+    parser.add_argument('output', nargs='?', default='problems_clean.txt',
+                        help='clean file, or directory with --stream')
+    parser.add_argument('--stream', action='store_true',
+                        help='the input holds many problems, clean them one at a time')
+    parser.add_argument('--max-workers', type=int, default=None,
+                        help='processes used for a directory')
+    args = parser.parse_args()
+    
+    if args.stream:
+        if os.path.isdir(args.input):
+            counts = clean_directory(args.input, args.output, max_workers=args.max_workers)
+            print(f"✓ Cleaned {sum(counts.values())} problems from {len(counts)} files!")
+        else:
+            count = clean_file(args.input, args.output)
+            print(f"✓ Cleaned {count} problems!")
+        return
+    
     # Read the raw file
-    with open('problems_raw.txt', 'r', encoding='utf-8') as f:
+    with open(args.input, 'r', encoding='utf-8') as f:
         raw_text = f.read()
     
     # Clean the text
     cleaned_text = clean_apple_books_text(raw_text)
     
     # Write to clean file
-    with open('problems_clean.txt', 'w', encoding='utf-8') as f:
+    with open(args.output, 'w', encoding='utf-8') as f:
         f.write(cleaned_text)
     
     print("✓ Text cleaned successfully!")
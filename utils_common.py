@@ -0,0 +1,368 @@
+# utils_common.py - Helpers shared by the loader classes of all notebook folders.
+# The utils modules put the repository root on sys.path before importing it.
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+def _timed_read(reader, path, kwargs):
+    """
+    Read a single file and return the result with the parse time in seconds.
+    Defined at module level so that it can be pickled by a process pool.
+    """
+    start = time.perf_counter()
+    result = reader(path, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def read_files_parallel(paths, reader=pd.read_csv, executor='thread',
+                        max_workers=None, verbose=False, **kwargs):
+    """
+    Read several files with `reader(path, **kwargs)` using a pool of workers.
+    paths: list of file paths, the results keep this order.
+    executor: 'thread', 'process' or 'serial' (plain loop, no pool).
+    Returns a list of results and a dict with the parse time (seconds) per path.
+    """
+    paths = list(paths)
+    if executor == 'serial':
+        results = [_timed_read(reader, path, kwargs) for path in paths]
+    elif executor in ('thread', 'process'):
+        pool_class = ThreadPoolExecutor if executor == 'thread' else ProcessPoolExecutor
+        with pool_class(max_workers=max_workers) as pool:
+            # map() returns results in the order of the input paths
+            results = list(pool.map(_timed_read,
+                                    [reader] * len(paths),
+                                    paths,
+                                    [kwargs] * len(paths)))
+    else:
+        raise ValueError("executor must be 'thread', 'process' or 'serial'")
+
+    frames = [frame for frame, _ in results]
+    load_times = {path: seconds for path, (_, seconds) in zip(paths, results)}
+
+    if verbose:
+        for path, seconds in load_times.items():
+            print(f"{path}: {seconds:.3f} s")
+
+    return frames, load_times
+
+
+def _cache_key(name, sources, params):
+    """
+    Hash the loader name, the path, size and mtime of every source file and the
+    loader parameters into a short hex key.
+    """
+    stats = []
+    for path in sources:
+        stat = os.stat(path)
+        stats.append([os.path.abspath(path), stat.st_size, stat.st_mtime_ns])
+    payload = json.dumps({'name': name, 'sources': stats, 'params': params},
+                         sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def load_cached(loader, sources, cache_dir=None, **params):
+    """
+    Return loader(), persisting the resulting DataFrame as Parquet in `cache_dir`.
+    sources: files read by the loader; any change in their size or mtime invalidates the cache.
+    params: loader arguments (usecols, date_format, ...) that are part of the cache key.
+    If cache_dir is None the loader is simply called. Parquet requires pyarrow.
+    """
+    if cache_dir is None:
+        return loader()
+
+    name = getattr(loader, '__qualname__', 'frame')
+    key = _cache_key(name, list(sources), params)
+    cache_path = os.path.join(cache_dir, f'{name}-{key}.parquet')
+
+    if os.path.exists(cache_path):
+        return pd.read_parquet(cache_path)
+
+    df = loader()
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write to a temporary file first so that a crash never leaves a partial cache
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    df.to_parquet(tmp_path)
+    os.replace(tmp_path, cache_path)
+    return df
+
+
+def top_n_by_group(df, by, column, n):
+    """
+    Return the `n` rows with the largest `column` in every group of `by`.
+    Same rows as df.groupby(by).apply(lambda g: g.nlargest(n, column)), but with
+    one sort over the whole frame instead of a Python call per group: groups in
+    sorted order, rows in descending order of `column` and ties in their input
+    order. nlargest may order ties differently (its sort is not stable for groups
+    smaller than n), so the order only matches when the input is already sorted
+    by descending `column` within each group. The original index is kept.
+    """
+    by = [by] if isinstance(by, str) else list(by)
+
+    # Like groupby and nlargest, drop rows with a missing key or value
+    valid = df[by + [column]].notna().all(axis=1).to_numpy()
+    positions = np.flatnonzero(valid)
+
+    # Integer codes in sorted key order, one array per grouping column
+    codes = [pd.factorize(df[col].iloc[positions], sort=True)[0] for col in by]
+    values = df[column].to_numpy()[positions]
+
+    # np.lexsort is stable and uses the last key as the primary one
+    order = np.lexsort([-values] + codes[::-1])
+
+    # A sorted row starts a new group when any of its codes differs from the previous row
+    new_group = np.zeros(len(order), dtype=bool)
+    new_group[:1] = True
+    for c in codes:
+        sorted_codes = c[order]
+        new_group[1:] |= sorted_codes[1:] != sorted_codes[:-1]
+
+    # Position of every sorted row within its group
+    starts = np.flatnonzero(new_group)
+    sizes = np.diff(np.r_[starts, len(order)])
+    rank = np.arange(len(order)) - np.repeat(starts, sizes)
+
+    return df.iloc[positions[order[rank < n]]]
+
+
+class lazy_table:
+    """
+    Decorator for a derived table that is computed on first access and then kept
+    on the instance (like functools.cached_property).
+    depends_on: names of the attributes it is computed from, used by materialize()
+    to compute tables in dependency order and by invalidate() to drop dependents.
+    """
+
+    def __init__(self, *depends_on):
+        self.depends_on = depends_on
+        self.func = None
+        self.name = None
+
+    def __call__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+        return self
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        # Stored in the instance __dict__, which takes precedence on later lookups
+        value = self.func(instance)
+        instance.__dict__[self.name] = value
+        return value
+
+
+def _get_lazy_tables(cls):
+    """Return {name: lazy_table} for a class and its bases."""
+    tables = {}
+    for klass in reversed(cls.__mro__):
+        for name, attr in vars(klass).items():
+            if isinstance(attr, lazy_table):
+                tables[name] = attr
+    return tables
+
+
+def get_materialized(obj):
+    """Return the names of the lazy tables of obj that are already computed."""
+    return [name for name in _get_lazy_tables(type(obj)) if name in vars(obj)]
+
+
+def materialize(obj, *names, max_workers=None):
+    """
+    Compute the lazy tables `names` of obj (all of them if none are given) and
+    their lazy dependencies. Tables whose dependencies are ready are computed in
+    parallel on a thread pool, one dependency level at a time.
+    """
+    tables = _get_lazy_tables(type(obj))
+    names = names or tuple(tables)
+
+    # Collect the tables still to compute, with their lazy dependencies
+    needed = set()
+    stack = list(names)
+    while stack:
+        name = stack.pop()
+        if name not in tables:
+            raise AttributeError(f"{type(obj).__name__} has no lazy table '{name}'")
+        if name in needed or name in vars(obj):
+            continue
+        needed.add(name)
+        stack.extend(dep for dep in tables[name].depends_on if dep in tables)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while needed:
+            ready = [name for name in needed
+                     if not any(dep in needed for dep in tables[name].depends_on)]
+            list(pool.map(lambda name: getattr(obj, name), ready))
+            needed -= set(ready)
+
+
+def invalidate(obj, *names):
+    """
+    Drop the computed lazy tables `names` of obj and every table depending on
+    them, so that they are recomputed on next access.
+    """
+    tables = _get_lazy_tables(type(obj))
+    dropped = set(names)
+    changed = True
+    while changed:
+        dependents = {name for name, table in tables.items()
+                      if name not in dropped and dropped.intersection(table.depends_on)}
+        dropped |= dependents
+        changed = bool(dependents)
+
+    for name in dropped:
+        if name in tables:
+            vars(obj).pop(name, None)
+
+
+def _widen(series):
+    """Cast a Series to the dtype pandas infers by default when parsing a CSV."""
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return series.astype(object)
+    if pd.api.types.is_bool_dtype(dtype):
+        return series
+    if pd.api.types.is_integer_dtype(dtype):
+        # Nullable integers (e.g. 'UInt8') widen to the nullable Int64
+        return series.astype('int64' if isinstance(dtype, np.dtype) else 'Int64')
+    if pd.api.types.is_float_dtype(dtype):
+        return series.astype('float64')
+    return series
+
+
+def memory_report(df):
+    """
+    Compare the memory used by df with what pandas' default dtypes would use
+    (object instead of category, int64/float64 instead of narrower numbers).
+    Returns a DataFrame with bytes 'before' and 'after' per column (index levels
+    included), a 'total' row and the 'ratio' after/before.
+    """
+    frame = df if isinstance(df.index, pd.RangeIndex) else df.reset_index()
+    report = pd.DataFrame({
+        'before': {col: _widen(frame[col]).memory_usage(deep=True, index=False) for col in frame.columns},
+        'after': {col: frame[col].memory_usage(deep=True, index=False) for col in frame.columns},
+    })
+    report.loc['total'] = report.sum()
+    report['ratio'] = report['after'] / report['before']
+    return report
+
+
+class MemoryReportMixin:
+    """
+    Adds memory_report() to a loader class that declares a DTYPES schema. The report
+    covers the DataFrame attributes holding DTYPES columns (lazy tables excluded),
+    with one block per table when there are several.
+    """
+
+    def memory_report(self):
+        """Bytes per column with pandas' default dtypes (before) and the current ones (after)."""
+        lazy = _get_lazy_tables(type(self))
+        tables = {name: value for name, value in vars(self).items()
+                  if name not in lazy and isinstance(value, pd.DataFrame)
+                  and value.columns.isin(list(self.DTYPES)).any()}
+        if len(tables) == 1:
+            return memory_report(next(iter(tables.values())))
+        return pd.concat({name: memory_report(df) for name, df in tables.items()})
+
+
+def parse_distinct(values, parse):
+    """
+    Apply parse (e.g. a pd.to_datetime call) to the distinct values of a Series only
+    and broadcast the results to the rows through the factorize codes. Worth it when
+    a few thousand strings repeat across many rows. Missing values are parsed too.
+    """
+    codes, uniques = pd.factorize(values)
+    # A missing value at the end, picked by code -1 (take counts from the end)
+    uniques = pd.Series(np.append(np.asarray(uniques, dtype=object), np.nan))
+    parsed = pd.Series(parse(uniques))
+    return pd.Series(parsed.take(codes).to_numpy(), index=values.index, name=values.name)
+
+
+class MultiValueColumn:
+    """
+    Compact encoding of a column of delimited values such as 'Comedy|Drama'.
+    `values` holds the distinct values (sorted) and row i is a slice of `codes`:
+    values[codes[offsets[i]:offsets[i + 1]]] (CSR layout). Every distinct string
+    is split only once. Missing rows have no values, as in str.split().explode().
+    """
+
+    def __init__(self, column, sep='|'):
+        self.index = column.index
+        self.sep = sep
+
+        # Split each distinct string once
+        row_codes, uniques = pd.factorize(column)
+        parts = [str(unique).split(sep) for unique in np.asarray(uniques, dtype=object)]
+        part_codes, values = pd.factorize(
+            np.array([part for unique_parts in parts for part in unique_parts], dtype=object),
+            sort=True
+        )
+        self.values = pd.Index(values, name=column.name)
+
+        # Length and start in part_codes of each distinct string, code -1 (missing) is last
+        unique_lengths = np.array([len(unique_parts) for unique_parts in parts] + [0])
+        unique_starts = np.concatenate([[0], np.cumsum(unique_lengths)])[:-1]
+
+        self.lengths = unique_lengths[row_codes]
+        self.offsets = np.concatenate([[0], np.cumsum(self.lengths)])
+        # Entry j of row i is entry j of the row's distinct string
+        starts = np.repeat(unique_starts[row_codes] - self.offsets[:-1], self.lengths)
+        self.codes = part_codes[starts + np.arange(self.offsets[-1])]
+
+    def __len__(self):
+        return len(self.lengths)
+
+    @property
+    def nbytes(self):
+        return self.codes.nbytes + self.offsets.nbytes + self.lengths.nbytes
+
+    def row_positions(self):
+        """Position of the row of every entry of codes."""
+        return np.repeat(np.arange(len(self)), self.lengths)
+
+    def explode(self):
+        """The values as str.split(sep).explode() would give them, without the missing rows."""
+        return pd.Series(self.values.take(self.codes), index=self.index.take(self.row_positions()),
+                         name=self.values.name)
+
+    def counts(self):
+        """Number of rows with each value."""
+        return pd.Series(np.bincount(self.codes, minlength=len(self.values)), index=self.values)
+
+    def contains(self, value):
+        """Boolean Series, True for the rows that have value."""
+        mask = np.zeros(len(self), dtype=bool)
+        if value in self.values:
+            mask[self.row_positions()[self.codes == self.values.get_loc(value)]] = True
+        return pd.Series(mask, index=self.index)
+
+    def aggregate(self, row_values):
+        """
+        Sum per value of row_values, an array with one row (or element) per row of
+        the column, without repeating the rows for each of their values.
+        """
+        row_values = np.asarray(row_values)
+        weights = row_values[self.row_positions()]
+        if weights.ndim == 1:
+            return np.bincount(self.codes, weights=weights, minlength=len(self.values))
+        return np.column_stack([
+            np.bincount(self.codes, weights=weights[:, k], minlength=len(self.values))
+            for k in range(weights.shape[1])
+        ])
+
+    def to_bitmask(self):
+        """One uint64 per row with bit k set when the row has values[k] (at most 64 values)."""
+        if len(self.values) > 64:
+            raise ValueError(f"A bitmask holds at most 64 values, the column has {len(self.values)}.")
+        masks = np.zeros(len(self), dtype=np.uint64)
+        np.bitwise_or.at(masks, self.row_positions(), np.left_shift(np.uint64(1), self.codes.astype(np.uint64)))
+        return masks